@@ -2,14 +2,15 @@
 
 import sys
 import os
+from importlib import import_module
+
+import pytest
 from boardfarm3 import hookimpl
 
 # Add current directory to Python path so our modules can be imported
-sys.path.insert(0, os.path.dirname(__file__))
-
-# Import our custom devices
-from rpi_cpe_device import RpiCpeDevice
-from rdk_cpe_device import RdkCpeDevice
+_PROJECT_DIR = os.path.dirname(__file__)
+if _PROJECT_DIR not in sys.path:
+    sys.path.insert(0, _PROJECT_DIR)
 
 # Import LXD connection
 from lxd_connection import LXDConnection
@@ -18,58 +19,101 @@ from lxd_connection import LXDConnection
 @hookimpl
 def boardfarm_add_devices():
     """Register custom devices with boardfarm."""
+    # Imported here so the device modules only load once boardfarm asks for them
+    from rpi_cpe_device import RpiCpeDevice
+    from rdk_cpe_device import RdkCpeDevice
+
     return {
         "rpi_cpe": RpiCpeDevice,
         "rdk_cpe": RdkCpeDevice
     }
 
 
+def cached_import(module_path, attr_name):
+    """Return an attribute of a module, importing the module only if needed."""
+    modules = sys.modules
+    module = modules.get(module_path)
+    if module is None or getattr(getattr(module, "__spec__", None), "_initializing", False):
+        import_module(module_path)
+    return getattr(modules[module_path], attr_name)
+
+
+def _lxd_connection(connection_name, **kwargs):
+    """Create an LXD connection from connection_factory style arguments."""
+    return LXDConnection(
+        name=connection_name,
+        container_name=kwargs.get("container_name", kwargs.get("hostname", "rdk-container")),
+        lxd_endpoint=kwargs.get("lxd_endpoint", "https://127.0.0.1:8443"),
+        shell_prompt=[kwargs.get("shell_prompt", "root@")],
+        save_console_logs=kwargs.get("save_console_logs", False),
+        cert_file=kwargs.get("cert_file"),
+        key_file=kwargs.get("key_file"),
+        trust_password=kwargs.get("trust_password"),
+    )
+
+
+# Connection types provided by this project, checked before boardfarm's own
+_CONNECTION_HANDLERS = {"lxd": _lxd_connection}
+
+# Boardfarm plugin manager, looked up once per session
+_PM = None
+
+
 def register_lxd_connection():
     """Register LXD connection type with boardfarm."""
-    import sys
-    from boardfarm3.lib import connection_factory
-    from boardfarm3.exceptions import EnvConfigError
-    
     # Store the original connection_factory function
-    original_factory = connection_factory.connection_factory
+    original_factory = cached_import("boardfarm3.lib.connection_factory", "connection_factory")
     
-    # Create a wrapper that adds LXD support
+    # Create a wrapper that adds our connection types
     def patched_connection_factory(connection_type, connection_name, **kwargs):
-        if connection_type == "lxd":
-            return LXDConnection(
-                name=connection_name,
-                container_name=kwargs.get("container_name", kwargs.get("hostname", "rdk-container")),
-                lxd_endpoint=kwargs.get("lxd_endpoint", "https://127.0.0.1:8443"),
-                shell_prompt=[kwargs.get("shell_prompt", "root@")],
-                save_console_logs=kwargs.get("save_console_logs", False),
-                cert_file=kwargs.get("cert_file"),
-                key_file=kwargs.get("key_file"),
-                trust_password=kwargs.get("trust_password"),
-            )
-        else:
-            # Fallback to original factory for other connection types
-            return original_factory(connection_type, connection_name, **kwargs)
+        handler = _CONNECTION_HANDLERS.get(connection_type)
+        if handler is not None:
+            return handler(connection_name, **kwargs)
+        # Fallback to original factory for other connection types
+        return original_factory(connection_type, connection_name, **kwargs)
     
     # Replace the connection_factory function in the module
-    connection_factory.connection_factory = patched_connection_factory
+    sys.modules["boardfarm3.lib.connection_factory"].connection_factory = patched_connection_factory
     
     # Also patch any modules that have already imported the function directly
     # This handles cases where modules do "from connection_factory import connection_factory"
-    for module_name, module in sys.modules.items():
-        if hasattr(module, 'connection_factory'):
-            # Check if it's the function we want to replace (not the module)
-            if callable(getattr(module, 'connection_factory')) and \
-               getattr(module, 'connection_factory').__module__ == 'boardfarm3.lib.connection_factory':
-                setattr(module, 'connection_factory', patched_connection_factory)
+    for module in list(sys.modules.values()):
+        module_dict = getattr(module, "__dict__", None)
+        if module_dict is not None and module_dict.get("connection_factory") is original_factory:
+            module_dict["connection_factory"] = patched_connection_factory
 
 
 def pytest_configure(config):
     """Configure pytest and register custom devices."""
-    from boardfarm3.main import get_plugin_manager
-    pm = get_plugin_manager()
+    global _PM
+    _PM = _PM or cached_import("boardfarm3.main", "get_plugin_manager")()
 
     # Register LXD connection type
     register_lxd_connection()
 
     # Register this module as a plugin so the hook is discovered
-    pm.register(sys.modules[__name__], name="custom_rpi_devices")
+    if not _PM.has_plugin("custom_rpi_devices"):
+        _PM.register(sys.modules[__name__], name="custom_rpi_devices")
+
+
+@pytest.fixture(scope="session")
+def rdk_cpes(device_manager):
+    """All RDK CPE devices of the session, looked up once."""
+    rdk_cpe_device = cached_import("rdk_cpe_device", "RdkCpeDevice")
+    return list(device_manager.get_devices_by_type(rdk_cpe_device).values())
+
+
+@pytest.fixture(scope="session")
+def rdk_board(rdk_cpes):
+    """The first RDK CPE device of the session."""
+    assert rdk_cpes, "No RDK CPE devices found"
+    return rdk_cpes[0]
+
+
+@pytest.fixture(scope="session")
+def rpi_board(device_manager):
+    """The first RPI CPE device of the session, looked up once."""
+    rpi_cpe_device = cached_import("rpi_cpe_device", "RpiCpeDevice")
+    devices = device_manager.get_devices_by_type(rpi_cpe_device)
+    assert devices, "No rpi_cpe devices found"
+    return next(iter(devices.values()))
@@ -2,24 +2,81 @@
 
 from __future__ import annotations
 
+import importlib.util
 import json
 import logging
+import re
 import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
-from urllib.parse import urljoin
 
 import httpx
 import pexpect
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from boardfarm3.exceptions import DeviceConnectionError
 from boardfarm3.lib.boardfarm_pexpect import BoardfarmPexpect
 
+_LOGGER = logging.getLogger(__name__)
+
 # Configure httpx logging to be less verbose
 logging.getLogger("httpx").setLevel(logging.WARNING)
 
 _CONNECTION_ERROR_THRESHOLD = 2
 _CONNECTION_FAILED_STR: str = "Connection failed to LXD container"
 _SHELL_PROMPT_UNAVAILABLE_STR = "Shell prompt is not available"
+_PROMPT_MARKER = "__PROMPT__"
+_LOGIN_COMMAND = (
+    f"echo 'LXD connection established'; echo {_PROMPT_MARKER}; echo $PS1 || echo '# '"
+)
+
+# HTTP/2 needs the optional "h2" package (pip install httpx[http2])
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+_JSON_HEADERS = {"Content-Type": "application/json"}
+# Constant part of the exec request body, "command" is ["bash", "-c", <command>]
+_EXEC_BODY_PREFIX = (
+    b'{"wait-for-websocket":false,"record-output":true,"interactive":false,'
+    b'"environment":{"TERM":"dumb",'
+    b'"PATH":"/usr/local/sbin:/usr/local/bin:/usr/sbin:/usr/bin:/sbin:/bin"},'
+    b'"command":["bash","-c",'
+)
+_EXEC_BODY_SUFFIX = b"]}"
+_LOG_CHUNK_SIZE = 65536
+_POLL_MIN_DELAY = 0.005
+_POLL_MAX_DELAY = 0.1
+_HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=16,
+    max_connections=32,
+    keepalive_expiry=60.0,
+)
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode JSON, using orjson when it is installed."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode JSON to bytes, using orjson when it is installed."""
+    return orjson.dumps(obj) if orjson is not None else json.dumps(obj).encode()
+
+
+def _close_client(client: httpx.Client, log_executor: ThreadPoolExecutor) -> None:
+    """Close an HTTP client and its log worker.
+
+    Runs from close() or from the finalizer, possibly during interpreter
+    shutdown, so errors are only logged.
+    """
+    log_executor.shutdown(wait=False)
+    try:
+        client.close()
+    except Exception:
+        _LOGGER.debug("Failed to close the LXD HTTP client", exc_info=True)
 
 
 class LXDConnection(BoardfarmPexpect):
@@ -68,13 +125,35 @@ class LXDConnection(BoardfarmPexpect):
         self._cert_file = cert_file
         self._key_file = key_file
         self._authenticated = False
-
-        # Setup HTTP client with optional certificates
-        client_kwargs = {"timeout": timeout, "verify": False}
-        if cert_file and key_file:
-            client_kwargs["cert"] = (cert_file, key_file)
-
-        self._client = httpx.Client(**client_kwargs)
+        # Log layout of the server ("paths" or "legacy"), found on first fetch
+        self._log_scheme: str | None = None
+        # Prompt reported by the container shell, discovered at login
+        self._shell_output = "# "
+        self._last_output_bytes = b""
+
+        # Setup a pooled HTTP client with optional certificates. TLS and HTTP/2
+        # options live on the transport since httpx ignores them on the client once
+        # an explicit transport is given.
+        transport = httpx.HTTPTransport(
+            verify=False,
+            cert=(cert_file, key_file) if cert_file and key_file else None,
+            http2=_HTTP2_AVAILABLE,
+            limits=_HTTP_LIMITS,
+            retries=1,
+        )
+        self._client = httpx.Client(
+            base_url=self._lxd_endpoint,
+            timeout=timeout,
+            transport=transport,
+        )
+        # Worker used to fetch stdout while stderr is fetched by the caller
+        self._log_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"{name}-logs"
+        )
+        # Close both when the connection is garbage collected without close()
+        self._finalizer = weakref.finalize(
+            self, _close_client, self._client, self._log_executor
+        )
 
         # Create a pseudo-command for the parent pexpect class
         # We'll override most functionality but need something for initialization
@@ -93,14 +172,16 @@ class LXDConnection(BoardfarmPexpect):
         :rtype: dict[str, Any]
         :raises DeviceConnectionError: if API request fails
         """
-        url = urljoin(f"{self._lxd_endpoint}/", path.lstrip("/"))
+        if "json" in kwargs:
+            kwargs["content"] = _json_dumps(kwargs.pop("json"))
+            kwargs["headers"] = {**_JSON_HEADERS, **kwargs.get("headers", {})}
         try:
-            response = self._client.request(method, url, **kwargs)
+            response = self._client.request(method, path, **kwargs)
             response.raise_for_status()
-            return response.json()
+            return _json_loads(response.content)
         except (httpx.RequestError, httpx.HTTPStatusError) as e:
             # Add more detailed error information
-            error_msg = f"LXD API request failed: {method} {url} -> {e}"
+            error_msg = f"LXD API request failed: {method} {path} -> {e}"
             if hasattr(e, 'response') and e.response:
                 error_msg += f" (Response: {e.response.status_code})"
                 if e.response.content:
@@ -117,24 +198,23 @@ class LXDConnection(BoardfarmPexpect):
         if self._authenticated:
             return
 
+        # Certificate authentication is handled by httpx client
+        # Just mark as authenticated - the client cert will be used automatically,
+        # so there is no need to probe the server first
+        if self._cert_file and self._key_file:
+            self._authenticated = True
+            return
+
         try:
             # Get server info to check if we need authentication
-            response = self._client.get(f"{self._lxd_endpoint}/1.0")
+            response = self._client.get("/1.0")
             if response.status_code == 200:
                 # Check if we can access instances without auth
-                test_response = self._client.get(f"{self._lxd_endpoint}/1.0/instances")
+                test_response = self._client.get("/1.0/instances")
                 if test_response.status_code == 200:
                     self._authenticated = True
                     return
 
-            # If we have client certificates, they should be used automatically by httpx
-            # Just test if they work
-            if self._cert_file and self._key_file:
-                # Certificate authentication is handled by httpx client
-                # Just mark as authenticated - the client cert will be used automatically
-                self._authenticated = True
-                return
-
             # We need to authenticate with trust password
             if self._trust_password:
                 auth_data = {
@@ -143,7 +223,7 @@ class LXDConnection(BoardfarmPexpect):
                 }
 
                 response = self._client.post(
-                    f"{self._lxd_endpoint}/1.0/certificates",
+                    "/1.0/certificates",
                     json=auth_data
                 )
 
@@ -168,26 +248,18 @@ class LXDConnection(BoardfarmPexpect):
         :rtype: dict[str, Any]
         :raises DeviceConnectionError: if command execution fails
         """
-        # Create execution request - match the working curl format
-        exec_data = {
-            "command": ["bash", "-c", command],
-            "wait-for-websocket": False,
-            "record-output": True,
-            "interactive": False,
-            "environment": {
-                "TERM": "dumb",
-                "PATH": "/usr/local/sbin:/usr/local/bin:/usr/sbin:/usr/bin:/sbin:/bin"
-            }
-        }
+        # Create execution request - match the working curl format. Only the
+        # command varies, so it is spliced into the pre-encoded envelope
+        exec_body = _EXEC_BODY_PREFIX + _json_dumps(command) + _EXEC_BODY_SUFFIX
 
         # Start execution
         result = self._api_request(
             "POST",
             f"/1.0/instances/{self._container_name}/exec",
-            json=exec_data
+            content=exec_body,
+            headers=_JSON_HEADERS,
         )
 
-
         if result.get("type") != "async":
             raise DeviceConnectionError(f"Expected async operation from LXD exec, got: {result}")
 
@@ -198,85 +270,148 @@ class LXDConnection(BoardfarmPexpect):
 
         # Wait for operation to complete
         max_wait = timeout if timeout > 0 else self._timeout
-        start_time = time.time()
+        op_metadata = self._wait_for_operation(operation_id, max_wait)
 
-        while time.time() - start_time < max_wait:
-            op_result = self._api_request("GET", f"/1.0/operations/{operation_id}")
+        if op_metadata["status"] == "Success":
+            # Return the complete result including operation ID
+            return {"metadata": op_metadata, "id": operation_id}
+        if op_metadata["status"] == "Failure":
+            error_msg = op_metadata.get("err", "Unknown error")
+            raise DeviceConnectionError(f"Command execution failed: {error_msg}")
 
-            if op_result["metadata"]["status"] == "Success":
-                # Return the complete result including operation ID
-                result = {"metadata": op_result["metadata"], "id": operation_id}
-                return result
-            elif op_result["metadata"]["status"] == "Failure":
-                error_msg = op_result["metadata"].get("err", "Unknown error")
-                raise DeviceConnectionError(f"Command execution failed: {error_msg}")
+        raise DeviceConnectionError("Command execution timed out")
 
-            time.sleep(0.1)
+    def _wait_for_operation(self, operation_id: str, timeout: int) -> dict[str, Any]:
+        """Wait for an LXD operation to finish.
 
-        raise DeviceConnectionError("Command execution timed out")
+        Uses the blocking ``/wait`` endpoint so the server answers as soon as
+        the operation is done. Servers that reply with HTTP 408 fall back to
+        polling the operation state.
 
-    def _get_operation_logs(self, operation_id: str, metadata: dict = None) -> str:
+        :param operation_id: LXD operation ID
+        :type operation_id: str
+        :param timeout: maximum time to wait in seconds
+        :type timeout: int
+        :return: operation metadata, still running if the wait timed out
+        :rtype: dict[str, Any]
+        :raises DeviceConnectionError: if the API request fails
+        """
+        try:
+            op_result = self._api_request(
+                "GET",
+                f"/1.0/operations/{operation_id}/wait",
+                params={"timeout": timeout},
+                # Leave the server time to answer before the client gives up
+                timeout=timeout + 5,
+            )
+            return op_result["metadata"]
+        except DeviceConnectionError as e:
+            cause = e.__cause__
+            if not (
+                isinstance(cause, httpx.HTTPStatusError)
+                and cause.response.status_code == 408
+            ):
+                raise
+
+        return self._poll_operation(operation_id, timeout)
+
+    def _poll_operation(self, operation_id: str, timeout: int) -> dict[str, Any]:
+        """Poll an LXD operation until it is no longer running.
+
+        :param operation_id: LXD operation ID
+        :type operation_id: str
+        :param timeout: maximum time to wait in seconds
+        :type timeout: int
+        :return: last seen operation metadata
+        :rtype: dict[str, Any]
+        """
+        start_time = time.time()
+        op_metadata: dict[str, Any] = {"status": "Running"}
+        # Back off exponentially so short commands are picked up quickly
+        delay = _POLL_MIN_DELAY
+
+        while time.time() - start_time < timeout:
+            op_metadata = self._api_request("GET", f"/1.0/operations/{operation_id}")["metadata"]
+            if op_metadata["status"] in ("Success", "Failure"):
+                break
+            time.sleep(delay)
+            delay = min(delay * 2, _POLL_MAX_DELAY)
+
+        return op_metadata
+
+    def _fetch_log(self, url: str | None) -> bytes | None:
+        """Fetch a single operation log.
+
+        :param url: log URL, None if the server did not report one
+        :return: raw log bytes or None if unavailable
+        """
+        if url is None:
+            return None
+        try:
+            with self._client.stream("GET", url) as response:
+                if response.status_code == 200:
+                    # Collect raw chunks, decoding is left to the consumer
+                    buffer = bytearray()
+                    for chunk in response.iter_bytes(_LOG_CHUNK_SIZE):
+                        buffer.extend(chunk)
+                    return bytes(buffer)
+        except Exception:
+            pass
+        return None
+
+    def _fetch_output(self, stdout_url: str | None, stderr_url: str | None) -> list[bytes]:
+        """Fetch stdout and stderr of an operation concurrently.
+
+        The stdout request runs on the log worker while stderr is fetched from
+        the calling thread, so a command pays a single round-trip for both.
+
+        :param stdout_url: stdout log URL
+        :param stderr_url: stderr log URL
+        :return: output parts, stderr prefixed with b"STDERR: "
+        """
+        stdout_future = self._log_executor.submit(self._fetch_log, stdout_url)
+        stderr_data = self._fetch_log(stderr_url)
+        stdout_data = stdout_future.result()
+
+        output_parts = []
+        if stdout_data is not None:
+            output_parts.append(stdout_data)
+        if stderr_data and stderr_data.strip():
+            output_parts.append(b"STDERR: " + stderr_data)
+        return output_parts
+
+    def _get_operation_logs(self, operation_id: str, metadata: dict = None) -> bytes:
         """Get logs from an operation.
 
         :param operation_id: LXD operation ID
         :param metadata: Operation metadata containing output paths
-        :return: Combined stdout/stderr output
+        :return: Combined raw stdout/stderr output
         """
         try:
             output_parts = []
 
             # If metadata is provided and contains output paths, use those
-            if metadata and "metadata" in metadata and "metadata" in metadata["metadata"] and "output" in metadata["metadata"]["metadata"]:
+            if self._log_scheme != "legacy" and metadata and "metadata" in metadata and "metadata" in metadata["metadata"] and "output" in metadata["metadata"]["metadata"]:
                 output_paths = metadata["metadata"]["metadata"]["output"]
+                output_parts = self._fetch_output(
+                    output_paths.get("1"),
+                    output_paths.get("2"),
+                )
+                if output_parts:
+                    self._log_scheme = "paths"
 
-                # Try to get stdout (file descriptor 1)
-                if "1" in output_paths:
-                    stdout_path = output_paths["1"]
-                    try:
-                        stdout_response = self._client.get(f"{self._lxd_endpoint}{stdout_path}")
-                        if stdout_response.status_code == 200:
-                            stdout_text = stdout_response.text
-                            if stdout_text is not None:
-                                output_parts.append(stdout_text)
-                    except Exception:
-                        pass
-
-                # Try to get stderr (file descriptor 2)
-                if "2" in output_paths:
-                    stderr_path = output_paths["2"]
-                    try:
-                        stderr_response = self._client.get(f"{self._lxd_endpoint}{stderr_path}")
-                        if stderr_response.status_code == 200:
-                            stderr_text = stderr_response.text
-                            if stderr_text and stderr_text.strip():
-                                output_parts.append(f"STDERR: {stderr_text}")
-                    except Exception:
-                        pass
+            # Fallback to old method if new method doesn't work, unless the
+            # server is already known to provide output paths
+            if not output_parts and self._log_scheme != "paths":
+                logs_url = f"/1.0/operations/{operation_id}/logs"
+                output_parts = self._fetch_output(f"{logs_url}/stdout", f"{logs_url}/stderr")
+                if output_parts:
+                    self._log_scheme = "legacy"
 
-            # Fallback to old method if new method doesn't work
-            if not output_parts:
-                try:
-                    stdout_response = self._client.get(f"{self._lxd_endpoint}/1.0/operations/{operation_id}/logs/stdout")
-                    if stdout_response.status_code == 200:
-                        stdout_text = stdout_response.text
-                        if stdout_text is not None:
-                            output_parts.append(stdout_text)
-                except:
-                    pass
-
-                try:
-                    stderr_response = self._client.get(f"{self._lxd_endpoint}/1.0/operations/{operation_id}/logs/stderr")
-                    if stderr_response.status_code == 200:
-                        stderr_text = stderr_response.text
-                        if stderr_text and stderr_text.strip():
-                            output_parts.append(f"STDERR: {stderr_text}")
-                except:
-                    pass
-
-            return "\n".join(output_parts) if output_parts else ""
+            return b"\n".join(output_parts)
 
         except Exception as e:
-            return ""
+            return b""
 
     def login_to_server(self, password: str | None = None) -> None:
         """Login to LXD container.
@@ -294,18 +429,20 @@ class LXDConnection(BoardfarmPexpect):
             container_info = self._api_request("GET", f"/1.0/instances/{self._container_name}")
             if container_info["metadata"]["status"] != "Running":
                 # Try to start the container
-                self._api_request("PUT", f"/1.0/instances/{self._container_name}/state",
-                                json={"action": "start", "timeout": 30})
+                start_result = self._api_request(
+                    "PUT", f"/1.0/instances/{self._container_name}/state",
+                    json={"action": "start", "timeout": 30},
+                )
 
-                # Wait for container to start
-                start_time = time.time()
-                while time.time() - start_time < 30:
+                # Wait for the start operation. Its result tells whether the
+                # container started; only re-read the state when it does not
+                op_status = None
+                if operation_id := start_result.get("metadata", {}).get("id"):
+                    op_status = self._wait_for_operation(operation_id, 30)["status"]
+                if op_status != "Success":
                     container_info = self._api_request("GET", f"/1.0/instances/{self._container_name}")
-                    if container_info["metadata"]["status"] == "Running":
-                        break
-                    time.sleep(1)
-                else:
-                    raise DeviceConnectionError(f"Container {self._container_name} failed to start")
+                    if container_info["metadata"]["status"] != "Running":
+                        raise DeviceConnectionError(f"Container {self._container_name} failed to start")
 
         except DeviceConnectionError as e:
             if "not found" in str(e).lower():
@@ -316,11 +453,18 @@ class LXDConnection(BoardfarmPexpect):
         if not self._shell_prompt:
             raise ValueError(_SHELL_PROMPT_UNAVAILABLE_STR)
 
+        # Test the connection and get the actual prompt (used by expect())
+        # from the container in a single exec call
         try:
-            result = self._exec_command_api("echo 'LXD connection established'")
+            result = self._exec_command_api(_LOGIN_COMMAND)
         except DeviceConnectionError as e:
             raise DeviceConnectionError(f"{_CONNECTION_FAILED_STR}: {e}") from e
 
+        output = self._get_operation_logs(result.get("id", ""), result)
+        _, _, prompt_output = output.partition(f"{_PROMPT_MARKER}\n".encode())
+        # Use the actual prompt or fall back to default
+        self._shell_output = prompt_output.decode("utf-8", "replace").strip() or "# "
+
     def sendline(self, command: str = "") -> None:
         """Send a command line to the container (pexpect compatibility).
 
@@ -329,7 +473,7 @@ class LXDConnection(BoardfarmPexpect):
         if not command.strip():
             # Empty command, just simulate sending newline
             self._last_command = "echo"  # Dummy command for empty input
-            self._last_output = ""
+            self._last_output_bytes = b""
             return
 
         self._last_command = command.strip()
@@ -337,11 +481,11 @@ class LXDConnection(BoardfarmPexpect):
             result = self._exec_command_api(command, timeout=30)
             operation_id = result.get("id", "")
             if operation_id:
-                self._last_output = self._get_operation_logs(operation_id, result)
+                self._last_output_bytes = self._get_operation_logs(operation_id, result)
             else:
-                self._last_output = ""
+                self._last_output_bytes = b""
         except Exception as e:
-            self._last_output = f"ERROR: {e}"
+            self._last_output_bytes = f"ERROR: {e}".encode()
 
     def expect(self, patterns, timeout: int = 30):
         """Wait for expected pattern (pexpect compatibility).
@@ -350,28 +494,11 @@ class LXDConnection(BoardfarmPexpect):
         :param timeout: timeout in seconds
         :return: index of matched pattern
         """
-        import re
-
         # For LXD, we simulate the shell prompt by checking if we have output
-        # and then matching against common prompt patterns
-
-        # Get the shell prompt from the container
-        if not hasattr(self, '_shell_output'):
-            try:
-                # Get actual prompt from container
-                result = self._exec_command_api("echo $PS1 || echo '# '", timeout=5)
-                operation_id = result.get("id", "")
-                if operation_id:
-                    prompt_output = self._get_operation_logs(operation_id, result)
-                    # Use the actual prompt or fall back to default
-                    self._shell_output = prompt_output.strip() or "# "
-                else:
-                    self._shell_output = "# "
-            except:
-                self._shell_output = "# "
+        # and then matching against the prompt discovered at login
 
         # Set the before/after attributes for pexpect compatibility
-        self.before = getattr(self, '_last_output', '')
+        self.before = self.get_last_output()
         self.after = self._shell_output
 
         # If patterns is a list, check each one
@@ -381,9 +508,9 @@ class LXDConnection(BoardfarmPexpect):
                     # Simple string match
                     if pattern in self._shell_output or '# ' in self._shell_output:
                         return i
-                else:
-                    # Regex pattern
-                    if re.search(pattern, self._shell_output):
+                elif isinstance(pattern, re.Pattern):
+                    # Precompiled regex, search it directly
+                    if pattern.search(self._shell_output):
                         return i
             # No pattern matched, return 0 for first pattern
             return 0
@@ -393,12 +520,15 @@ class LXDConnection(BoardfarmPexpect):
 
     def expect_exact(self, pattern: str, timeout: int = 30):
         """Expect exact string match (pexpect compatibility)."""
-        self.before = getattr(self, '_last_output', '')
+        self.before = self.get_last_output()
         return 0
 
     def get_last_output(self) -> str:
-        """Get output from last command (pexpect compatibility)."""
-        return getattr(self, '_last_output', '')
+        """Get output from last command (pexpect compatibility).
+
+        The raw output is kept as bytes and only decoded when requested.
+        """
+        return self._last_output_bytes.decode("utf-8", "replace")
 
     def execute_command(self, command: str, timeout: int = -1) -> str:
         """Execute a command in the LXD container.
@@ -420,7 +550,7 @@ class LXDConnection(BoardfarmPexpect):
                 # Try to get command output from logs, pass the full result for metadata
                 output = self._get_operation_logs(operation_id, result)
                 if output:
-                    return output.strip()
+                    return output.decode("utf-8", "replace").strip()
 
             # Fallback to metadata output
             metadata = result.get("metadata", {})
@@ -475,10 +605,6 @@ class LXDConnection(BoardfarmPexpect):
 
     def close(self) -> None:
         """Close the connection."""
-        self._client.close()
-        super().close()
-
-    def __del__(self) -> None:
-        """Cleanup on deletion."""
-        if hasattr(self, '_client'):
-            self._client.close()
\ No newline at end of file
+        # Closes the HTTP client and log worker once; later calls and GC are no-ops
+        self._finalizer()
+        super().close()
\ No newline at end of file
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import json
 import logging
 import re
-from functools import cached_property
-from ipaddress import AddressValueError, IPv4Address
-from time import sleep
+import tempfile
+from functools import cached_property, lru_cache
+from ipaddress import AddressValueError, IPv4Address, IPv4Interface, IPv6Interface
+from time import monotonic, sleep
 from typing import TYPE_CHECKING, Any
 
 import jc
@@ -15,6 +17,7 @@ from boardfarm3 import hookimpl
 from boardfarm3.devices.base_devices.boardfarm_device import BoardfarmDevice
 from boardfarm3.devices.base_devices.linux_device import LinuxDevice
 from boardfarm3.exceptions import (
+    CodeError,
     ConfigurationFailure,
     DeviceBootFailure,
     NotSupportedError,
@@ -38,6 +41,124 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+_IPV4_RE = re.compile(r"\b(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\b")
+
+# Seconds to wait for CWMP to report disabled while it is reconfigured
+_CWMP_DISABLE_TIMEOUT = 2
+# Backoff used while polling for CWMP to report disabled
+_CWMP_POLL_INITIAL_INTERVAL = 0.0625
+_CWMP_POLL_MAX_INTERVAL = 0.25
+
+# Seconds a parsed ifconfig output is reused by RdkRpiHW.ifconfig()
+_IFCONFIG_CACHE_TTL = 1.0
+
+# Backoff used while polling the board for readiness
+_POLL_INITIAL_INTERVAL = 0.25
+_POLL_MAX_INTERVAL = 2.0
+
+# iperf server log on the board and time allowed for the server to show up
+_IPERF_SERVER_LOG_PATH = f"{tempfile.gettempdir()}/iperf_server_logs.txt"
+_IPERF_START_TIMEOUT = 2
+_IPERF_PID_FILE_PATH = f"{tempfile.gettempdir()}/iperf_{{port}}.pid"
+_IPERF_CLIENT_LOG_PATH = f"{tempfile.gettempdir()}/iperf_client_logs.txt"
+
+# PID echoed after starting a process in the background ("cmd & echo PID=$!")
+_BACKGROUND_PID_RE = re.compile(r"PID=(\d+)")
+# PID reported by the on-board pgrep poll ("FOUND=$pid")
+_FOUND_PID_RE = re.compile(r"FOUND=(\d+)")
+# Prints "<pid>:<command line>" for every process on the board
+_PROC_CMDLINE_COMMAND = (
+    "for p in /proc/[0-9]*; do echo \"${p#/proc/}:$(tr '\\0' ' ' < $p/cmdline 2>/dev/null)\"; done"
+)
+
+# Time allowed for the board to go down after "reboot" and to come back
+_REBOOT_GRACE_PERIOD = 5
+_POWER_CYCLE_TIMEOUT = 60
+
+_SECTION_MARKER_RE = re.compile(r"===(\w+)===")
+
+# Serial number of the Raspberry Pi, single process stopping at first match
+_SERIAL_COMMAND = "awk '/^Serial/{print $3; exit}' /proc/cpuinfo"
+
+# Boot time identifiers gathered in one console round trip, each section is
+# introduced by a marker line parsed by _split_sections()
+_BOOT_INFO_COMMAND = (
+    "echo ===MAC===; ifconfig erouter0; "
+    f"echo ===SER===; {_SERIAL_COMMAND}; "
+    "echo ===VER===; cat /version.txt 2>/dev/null || uname -r; "
+    "echo ===END==="
+)
+
+# Basic system info reported by RdkSW.json_values when dmcli is unavailable
+_SYSTEM_INFO_COMMAND = (
+    "echo ===HOST===; hostname; echo ===KERNEL===; uname -r; "
+    "echo ===UPTIME===; uptime; echo ===END==="
+)
+
+# DeviceInfo parameters reported in RdkSW.json_values
+_JSON_DEVICE_PARAMS = (
+    "Device.DeviceInfo.SerialNumber",
+    "Device.DeviceInfo.ModelName",
+    "Device.DeviceInfo.Manufacturer",
+    "Device.DeviceInfo.SoftwareVersion",
+    "Device.DeviceInfo.HardwareVersion",
+    "Device.DeviceInfo.UpTime",
+    "Device.DeviceInfo.ProductClass",
+)
+
+
+def _split_sections(output: str) -> dict[str, str]:
+    """Split marker delimited command output into named sections.
+
+    Only lines consisting solely of a ``===NAME===`` marker start a section,
+    so markers echoed back as part of the command line are ignored.
+
+    :param output: combined command output
+    :type output: str
+    :return: section text keyed by marker name
+    :rtype: dict[str, str]
+    """
+    sections: dict[str, list[str]] = {}
+    current: list[str] | None = None
+    for line in output.splitlines():
+        if marker := _SECTION_MARKER_RE.fullmatch(line.strip()):
+            current = sections.setdefault(marker.group(1), [])
+        elif current is not None:
+            current.append(line)
+    return {name: "\n".join(lines).strip() for name, lines in sections.items()}
+
+
+@lru_cache(maxsize=32)
+def _iperf_client_pattern(host: str, port: int) -> re.Pattern[str]:
+    """Get the pattern matching the command line of an iperf client.
+
+    :param host: server the client connects to
+    :type host: str
+    :param port: server port
+    :type port: int
+    :return: compiled pattern, cached for the most recent hosts and ports
+    :rtype: re.Pattern[str]
+    """
+    return re.compile(rf" -c {re.escape(host)} -p {port}(?!\d)")
+
+
+def _brief_addresses(output: str, iface: str) -> list[str] | None:
+    """Get the addresses of an interface from "ip -br addr" output.
+
+    :param output: "ip -br addr show dev <iface>" command output
+    :type output: str
+    :param iface: interface name
+    :type iface: str
+    :return: addresses with prefix length, None if the interface is missing
+    :rtype: list[str] | None
+    """
+    for line in output.splitlines():
+        # e.g. "erouter0@if4  UP  10.0.0.2/24 fe80::1/64"
+        cols = line.split()
+        if cols and cols[0].partition("@")[0] == iface:
+            return cols[2:]
+    return None
+
 
 class RdkRpiHW(CPEHW):
     """RDK Raspberry Pi hardware device class."""
@@ -51,6 +172,15 @@ class RdkRpiHW(CPEHW):
         self._config = config
         self._cmdline_args = cmdline_args
         self._console: BoardfarmPexpect = None
+        # Config values read on hot paths, resolved once
+        self._wan_iface: str = config.get("wan_interface", "erouter0")
+        # Identifiers gathered by collect_boot_info()
+        self._boot_info: dict[str, str] = {}
+        # Values read from the board, valid until it reboots or disconnects
+        self._mac_address_cached: str | None = None
+        self._serial_cached: str | None = None
+        # Parsed ifconfig output per interface with the time it was read
+        self._ifconfig_cache: dict[str, tuple[float, dict[str, Any]]] = {}
 
     @property
     def config(self) -> dict[str, Any]:
@@ -61,6 +191,16 @@ class RdkRpiHW(CPEHW):
         """
         return self._config
 
+    @property
+    def boot_info(self) -> dict[str, str]:
+        """Identifiers gathered by collect_boot_info().
+
+        :return: values keyed by "mac", "serial" and "version", empty until
+            collect_boot_info() succeeds
+        :rtype: dict[str, str]
+        """
+        return self._boot_info
+
     @property
     def mac_address(self) -> str:
         """Get CPE MAC address.
@@ -68,21 +208,16 @@ class RdkRpiHW(CPEHW):
         :return: MAC address
         :rtype: str
         """
+        if self._mac_address_cached is not None:
+            return self._mac_address_cached
+        if mac := self._boot_info.get("mac"):
+            self._mac_address_cached = mac
+            return mac
         if self._console:
             try:
-                # Use a simpler command to avoid line-breaking issues
-                output = self._console.execute_command("ifconfig erouter0", timeout=5)
-                # Parse MAC address from ifconfig output
-                import re
-                mac_match = re.search(r'HWaddr\s+([0-9a-fA-F:]{17})', output)
-                if mac_match:
-                    return mac_match.group(1).lower()
-
-                # Fallback: try modern format
-                mac_match = re.search(r'ether\s+([0-9a-fA-F:]{17})', output)
-                if mac_match:
-                    return mac_match.group(1).lower()
-
+                if mac := self.ifconfig("erouter0").get("mac_addr"):
+                    self._mac_address_cached = mac.lower()
+                    return self._mac_address_cached
             except Exception:
                 _LOGGER.warning("Failed to get MAC address, using default")
 
@@ -95,14 +230,17 @@ class RdkRpiHW(CPEHW):
         :return: Serial number
         :rtype: str
         """
+        if self._serial_cached is not None:
+            return self._serial_cached
+        if serial := self._boot_info.get("serial"):
+            self._serial_cached = serial
+            return serial
         if self._console:
             try:
-                output = self._console.execute_command(
-                    "cat /proc/cpuinfo | grep Serial | awk '{print $3}'",
-                    timeout=5
-                )
+                output = self._console.execute_command(_SERIAL_COMMAND, timeout=5)
                 if output and output.strip():
-                    return output.strip()
+                    self._serial_cached = output.strip()
+                    return self._serial_cached
             except Exception:
                 _LOGGER.warning("Failed to get serial number, using default")
 
@@ -115,7 +253,7 @@ class RdkRpiHW(CPEHW):
         :return: the wan interface name
         :rtype: str
         """
-        return self._config.get("wan_interface", "erouter0")
+        return self._wan_iface
 
     @property
     def mta_iface(self) -> str:
@@ -125,19 +263,56 @@ class RdkRpiHW(CPEHW):
         """
         raise NotSupportedError
 
-    @property
+    @cached_property
     def _shell_prompt(self) -> list[str]:
         """Console prompt.
 
+        Computed once per instance, the configured prompt does not change.
+
         :return: the shell prompt
         :rtype: list[str]
         """
         prompt = self._config.get("shell_prompt", "root@RaspberryPi-Gateway")
         # Escape special regex characters and create more flexible patterns
-        import re
         escaped_prompt = re.escape(prompt)
         return [f"{escaped_prompt}.*#\\s*", f"{escaped_prompt}.*\\$\\s*", "/ #"]
 
+    def ifconfig(self, iface: str, max_age: float = _IFCONFIG_CACHE_TTL) -> dict[str, Any]:
+        """Get the parsed ifconfig output of an interface.
+
+        The result is reused for a short while, so reading several fields of
+        the same interface costs a single console command.
+
+        :param iface: interface name
+        :type iface: str
+        :param max_age: seconds a previous read is reused, 0 always reads the
+            interface again, defaults to _IFCONFIG_CACHE_TTL
+        :type max_age: float
+        :raises ValueError: when ifconfig data is not available
+        :return: ifconfig data as parsed by jc
+        :rtype: dict[str, Any]
+        """
+        now = monotonic()
+        if (cached := self._ifconfig_cache.get(iface)) and now - cached[0] < max_age:
+            return cached[1]
+        output = self._console.execute_command(f"ifconfig {iface}", timeout=10)
+        if not (ifconfig_data := jc.parse("ifconfig", output, quiet=True)):
+            msg = f"ifconfig {iface} is not available"
+            raise ValueError(msg)
+        self._ifconfig_cache[iface] = (now, ifconfig_data[0])
+        return ifconfig_data[0]  # type: ignore[index]
+
+    def wan_addresses(self) -> list[str] | None:
+        """Get the addresses of the WAN interface from "ip -br addr".
+
+        :return: addresses with prefix length, None if the interface is missing
+        :rtype: list[str] | None
+        """
+        output = self._console.execute_command(
+            f"ip -br addr show dev {self.wan_iface} 2>/dev/null", timeout=5
+        )
+        return _brief_addresses(output, self.wan_iface)
+
     def connect_to_consoles(self, device_name: str) -> None:
         """Establish connection to the device console.
 
@@ -197,11 +372,47 @@ class RdkRpiHW(CPEHW):
         msg = f"Unknown console name: {console_name}"
         raise ValueError(msg)
 
+    def collect_boot_info(self) -> dict[str, str]:
+        """Gather MAC address, serial number and version in one command.
+
+        The results are cached and consulted by mac_address, serial_number
+        and RdkSW.version before they fall back to their own commands.
+
+        :return: collected values keyed by "mac", "serial" and "version"
+        :rtype: dict[str, str]
+        """
+        try:
+            output = self._console.execute_command(_BOOT_INFO_COMMAND, timeout=10)
+        except Exception as e:
+            _LOGGER.warning("Failed to collect boot info: %s", str(e))
+            return self._boot_info
+
+        sections = _split_sections(output)
+        boot_info: dict[str, str] = {}
+        if (ifconfig_data := jc.parse("ifconfig", sections.get("MAC", ""), quiet=True)) and (
+            mac := ifconfig_data[0].get("mac_addr")  # type: ignore[index]
+        ):
+            boot_info["mac"] = mac.lower()
+        if serial := sections.get("SER"):
+            boot_info["serial"] = serial
+        if version := sections.get("VER"):
+            boot_info["version"] = version
+        self._boot_info = boot_info
+        return boot_info
+
     def disconnect_from_consoles(self) -> None:
         """Disconnect/Close the console connections."""
+        self._clear_cached_identity()
         if self._console is not None:
             self._console.close()
 
+    def _clear_cached_identity(self) -> None:
+        """Drop values read from the board so they are read again."""
+        self._boot_info = {}
+        self._mac_address_cached = None
+        self._serial_cached = None
+        self._ifconfig_cache = {}
+
     def get_interactive_consoles(self) -> dict[str, BoardfarmPexpect]:
         """Get interactive consoles of the device.
 
@@ -210,12 +421,29 @@ class RdkRpiHW(CPEHW):
         return {"console": self._console}
 
     def power_cycle(self) -> None:
-        """Power cycle the CPE via cli."""
+        """Power cycle the CPE via cli.
+
+        :raises DeviceBootFailure: if the console is not back in time
+        """
         self._console.execute_command("reboot")
-        # Sleep for 30s for Raspberry Pi to restart
-        sleep(30)
         self.disconnect_from_consoles()
-        self.connect_to_consoles("board")
+        # Let the board go down, then reconnect as soon as it answers
+        sleep(_REBOOT_GRACE_PERIOD)
+        deadline = monotonic() + _POWER_CYCLE_TIMEOUT
+        while True:
+            try:
+                self.connect_to_consoles("board")
+                return
+            except Exception as e:
+                if monotonic() >= deadline:
+                    msg = f"Console not available {_POWER_CYCLE_TIMEOUT}s after reboot"
+                    raise DeviceBootFailure(msg) from e
+                _LOGGER.debug("Console not ready after reboot: %s", str(e))
+                try:
+                    self.disconnect_from_consoles()
+                except Exception:
+                    pass
+            sleep(1)
 
     def flash_via_bootloader(
         self,
@@ -239,23 +467,31 @@ class RdkRpiHW(CPEHW):
         """
         raise NotSupportedError
 
-    def wait_for_hw_boot(self) -> None:
+    def wait_for_hw_boot(self, timeout: float = 30) -> None:
         """Wait for CPE to have WAN interface added.
 
+        :param timeout: seconds to wait for the WAN interface, defaults to 30
+        :type timeout: float
         :raises DeviceBootFailure: if CPE is unable to bring up WAN interface
         """
-        for attempt in range(3):  # Reduced attempts and timeout
+        deadline = monotonic() + timeout
+        interval = _POLL_INITIAL_INTERVAL
+        attempt = 0
+        while True:
+            attempt += 1
             try:
-                output = self._console.execute_command("ip a", timeout=10)
-                if self.wan_iface in output:
+                if self.wan_addresses() is not None:
                     _LOGGER.info("WAN interface %s found", self.wan_iface)
-                    break
+                    return
             except Exception as e:
-                _LOGGER.warning("Attempt %d: Error checking interfaces: %s", attempt + 1, str(e))
-            sleep(2)  # Shorter sleep
-        else:
-            # Don't fail - just warn and continue
-            _LOGGER.warning("WAN interface %s may not be ready, but continuing", self.wan_iface)
+                _LOGGER.warning("Attempt %d: Error checking interfaces: %s", attempt, str(e))
+            if monotonic() + interval >= deadline:
+                break
+            sleep(interval)
+            interval = min(interval * 2, _POLL_MAX_INTERVAL)
+
+        # Don't fail - just warn and continue
+        _LOGGER.warning("WAN interface %s may not be ready, but continuing", self.wan_iface)
 
 
 class RdkSW(CPESwLibraries):  # pylint: disable=R0904
@@ -270,6 +506,7 @@ class RdkSW(CPESwLibraries):  # pylint: disable=R0904
         :type hardware: RdkRpiHW
         """
         super().__init__(hardware)
+        self._lan_iface: str = hardware.config.get("lan_interface", "br0")
 
     @property
     def wifi(self) -> WiFiHal:
@@ -279,14 +516,16 @@ class RdkSW(CPESwLibraries):  # pylint: disable=R0904
         """
         raise NotSupportedError
 
-    @property
+    @cached_property
     def version(self) -> str:
         """CPE software version.
 
-        This will reload after each flash.
+        This will reload after each flash or reset.
         :return: version
         :rtype: str
         """
+        if version := self._hw.boot_info.get("version"):
+            return version
         try:
             return self._console.execute_command("cat /version.txt").strip()
         except Exception:
@@ -308,7 +547,7 @@ class RdkSW(CPESwLibraries):  # pylint: disable=R0904
         :return: LAN interface name
         :rtype: str
         """
-        return self._hw.config.get("lan_interface", "br0")
+        return self._lan_iface
 
     @property
     def guest_iface(self) -> str:
@@ -326,69 +565,47 @@ class RdkSW(CPESwLibraries):  # pylint: disable=R0904
         :return: the CPE Specific JSON values
         :rtype: dict[str, Any]
         """
-        json: dict[str, Any] = {}
+        values: dict[str, Any] = {}
 
         # For RDK, we use dmcli to get device parameters
         try:
-            # Use DMCLI library for getting device parameters
-            from shared.lib.dmcli import DMCLIAPI, DMCLIError
-            dmcli = DMCLIAPI(self._console)
-
-            # Define parameters to collect for JSON output
-            device_params = [
-                "Device.DeviceInfo.SerialNumber",
-                "Device.DeviceInfo.ModelName",
-                "Device.DeviceInfo.Manufacturer",
-                "Device.DeviceInfo.SoftwareVersion",
-                "Device.DeviceInfo.HardwareVersion",
-                "Device.DeviceInfo.UpTime",
-                "Device.DeviceInfo.ProductClass",
-            ]
-
-            for param in device_params:
-                try:
-                    result = dmcli.GPV(param)
-                    param_value = result.rval
-
-                    # Convert boolean strings to actual booleans
-                    if result.rtype in ("bool", "boolean"):
-                        param_value = param_value.lower() in ('true', '1')
-                    elif result.rtype in ("int", "unsignedInt", "uint32", "uint"):
-                        try:
-                            param_value = int(param_value)
-                        except ValueError:
-                            pass  # Keep as string if conversion fails
-                    elif param_value == '':
-                        param_value = None
-
-                    # Use a simplified key name (last part of the parameter path)
-                    key_parts = param.split('.')
-                    if len(key_parts) > 2:
-                        # Use last 2-3 parts for readability
-                        if len(key_parts) >= 3:
-                            simple_key = '.'.join(key_parts[-2:])
-                        else:
-                            simple_key = key_parts[-1]
-                    else:
-                        simple_key = param
-
-                    json[simple_key] = param_value
-
-                except DMCLIError:
-                    # Skip parameters that are not available
+            # Walk the whole DeviceInfo subtree in a single dmcli call and keep
+            # the parameters collected for JSON output
+            results = DMCLIAPI(self._console).GPV_tree("Device.DeviceInfo.", timeout=30)
+            for param, result in results.items():
+                if param not in _JSON_DEVICE_PARAMS:
                     continue
+                param_type, param_value = result.rtype, result.rval
+
+                # Convert boolean strings to actual booleans
+                if param_type in ("bool", "boolean"):
+                    param_value = param_value.lower() in ('true', '1')
+                elif param_type in ("int", "unsignedInt", "uint32", "uint"):
+                    try:
+                        param_value = int(param_value)
+                    except ValueError:
+                        pass  # Keep as string if conversion fails
+                elif param_value == '':
+                    param_value = None
+
+                # Use a simplified key name (last 2 parts of the parameter path)
+                simple_key = '.'.join(param.split('.')[-2:])
+                values[simple_key] = param_value
 
         except Exception as e:
             _LOGGER.warning("Failed to get dmcli device info: %s", str(e))
             # Fallback to basic system info
             try:
-                json["hostname"] = self._console.execute_command("hostname", timeout=5).strip()
-                json["kernel"] = self._console.execute_command("uname -r", timeout=5).strip()
-                json["uptime"] = self._console.execute_command("uptime", timeout=5).strip()
+                sections = _split_sections(
+                    self._console.execute_command(_SYSTEM_INFO_COMMAND, timeout=10)
+                )
+                values["hostname"] = sections.get("HOST", "")
+                values["kernel"] = sections.get("KERNEL", "")
+                values["uptime"] = sections.get("UPTIME", "")
             except Exception:
                 pass
 
-        return json
+        return values
 
     @property
     def gui_password(self) -> str:
@@ -406,14 +623,12 @@ class RdkSW(CPESwLibraries):  # pylint: disable=R0904
         :return: CPE ID
         :rtype: str
         """
-        console = self._get_console("default_shell")
-        try:
-            serial = console.execute_command("cat /proc/cpuinfo | grep Serial | awk '{print $3}'").strip()
-            # For RDK, OUI might be in a different location
-            oui = self._hw.config.get("oui", "001122")
-            return f"{oui}-{serial}"
-        except Exception:
-            return self._hw.config.get("cpe_id", "001122-000000000000")
+        # A configured CPE ID wins, e.g. when the board has no serial number
+        if cpe_id := self._hw.config.get("cpe_id"):
+            return cpe_id
+        # For RDK, OUI might be in a different location
+        oui = self._hw.config.get("oui", "001122")
+        return f"{oui}-{self._hw.serial_number}"
 
     @property
     def tr69_cpe_id(self) -> str:
@@ -432,21 +647,8 @@ class RdkSW(CPESwLibraries):  # pylint: disable=R0904
         :rtype: IPv4Address
         """
         try:
-            # Use main console with a very simple command
-            console = self._hw.get_console("console")
-            # Use ifconfig which has more predictable output format
-            output = console.execute_command(f"ifconfig {self.lan_iface}", timeout=10)
-
-            # Parse the ifconfig output for inet addr
-            import re
-            ip_match = re.search(r'inet addr:(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})', output)
-            if ip_match:
-                return IPv4Address(ip_match.group(1))
-
-            # Fallback: try modern ip command format
-            ip_match = re.search(r'inet (\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})/', output)
-            if ip_match:
-                return IPv4Address(ip_match.group(1))
+            if ipv4_addr := self._hw.ifconfig(self.lan_iface).get("ipv4_addr"):
+                return IPv4Address(ipv4_addr)
 
             _LOGGER.warning("No IP found in ifconfig output, using default")
             return IPv4Address("192.168.101.1")
@@ -455,14 +657,18 @@ class RdkSW(CPESwLibraries):  # pylint: disable=R0904
             # Check if the exception has the output we need (common with timeout)
             if hasattr(e, 'before') and e.before:
                 before_str = str(e.before)
-                # Look for IP pattern in the 'before' output
-                import re
-                ip_match = re.search(r'\b(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\b', before_str)
-                if ip_match:
+                # Look for usable addresses in the 'before' output, the last
+                # one is the most recent output (banners come first)
+                candidates = []
+                for ip_match in _IPV4_RE.finditer(before_str):
                     try:
-                        return IPv4Address(ip_match.group(1))
-                    except Exception:
-                        pass
+                        address = IPv4Address(ip_match.group(1))
+                    except AddressValueError:
+                        continue
+                    if not (address.is_link_local or address.is_loopback or address.is_multicast):
+                        candidates.append(address)
+                if candidates:
+                    return candidates[-1]
 
             _LOGGER.warning("Error getting LAN IP, using default: %s", str(e))
             return IPv4Address("192.168.101.1")
@@ -482,6 +688,8 @@ class RdkSW(CPESwLibraries):  # pylint: disable=R0904
         :param method: reset method(sw/hw)
         """
         self._hw.power_cycle()
+        # The image may have changed, read the version again on next access
+        self.__dict__.pop("version", None)
 
     def factory_reset(self, method: str | None = None) -> bool:  # noqa: ARG002
         """Perform factory reset CPE via given method.
@@ -518,23 +726,59 @@ class RdkSW(CPESwLibraries):  # pylint: disable=R0904
         """
         pass
 
-    def wait_device_online(self) -> None:
+    def wait_device_online(self, timeout: float = 30) -> None:
         """Wait for WAN interface to come online.
 
+        :param timeout: seconds to wait for the device, defaults to 30
+        :type timeout: float
         :raises DeviceBootFailure: if board is not online
         """
-        for attempt in range(5):  # Reduced attempts
+        deadline = monotonic() + timeout
+        interval = _POLL_INITIAL_INTERVAL
+        attempt = 0
+        while True:
+            attempt += 1
             try:
                 if self.is_online():
                     _LOGGER.info("Device is online")
                     return
             except Exception as e:
-                _LOGGER.warning("Attempt %d: Error checking online status: %s", attempt + 1, str(e))
-            sleep(5)  # Shorter sleep
+                _LOGGER.warning("Attempt %d: Error checking online status: %s", attempt, str(e))
+            if monotonic() + interval >= deadline:
+                break
+            sleep(interval)
+            interval = min(interval * 2, _POLL_MAX_INTERVAL)
 
         # Don't fail - just warn and continue
         _LOGGER.warning("Device may not be fully online, but continuing")
 
+    def is_online(self) -> bool:
+        """Is the device online.
+
+        Reads the WAN addresses with "ip -br addr" instead of ifconfig.
+
+        :return: True if the device is online, False otherwise
+        :rtype: bool
+        :raises ValueError: if erouter mode not in ["dual", "ipv4", "ipv6"]
+        """
+        mode = self.get_provision_mode()
+        if mode not in ("dual", "ipv4", "ipv6"):
+            msg = f"Unsupported mode: {mode}"
+            raise ValueError(msg)
+        addresses = self._hw.wan_addresses() or []
+        ipv4_addresses = [IPv4Interface(addr) for addr in addresses if ":" not in addr]
+        ipv6_addresses = [IPv6Interface(addr) for addr in addresses if ":" in addr]
+        online = True
+        if mode in ("dual", "ipv4"):
+            online &= any(
+                not (addr.is_link_local or addr.is_loopback) for addr in ipv4_addresses
+            )
+        if mode in ("dual", "ipv6"):
+            online &= any(
+                not (addr.is_link_local or addr.is_loopback) for addr in ipv6_addresses
+            )
+        return online
+
     def configure_management_server(
         self, url: str, username: str | None = "", password: str | None = ""
     ) -> None:
@@ -549,22 +793,31 @@ class RdkSW(CPESwLibraries):  # pylint: disable=R0904
         :param password: CWMP client password, defaults to ""
         :type password: str | None, optional
         """
-        console = self._get_console("default_shell")
         # RDK might use dmcli for TR-069 configuration
+        dmcli = DMCLIAPI(self._get_console("default_shell"))
+        params = [("Device.ManagementServer.URL", url, "string")]
+        if username:
+            params.append(("Device.ManagementServer.Username", username, "string"))
+        if password:
+            params.append(("Device.ManagementServer.Password", password, "string"))
         try:
-            # Use DMCLI library for TR-069 configuration
-            from shared.lib.dmcli import DMCLIAPI, DMCLIError
-            dmcli = DMCLIAPI(console)
-
-            dmcli.SPV("Device.ManagementServer.URL", url, "string")
-            dmcli.SPV("Device.ManagementServer.Username", username, "string")
-            if password:
-                dmcli.SPV("Device.ManagementServer.Password", password, "string")
+            dmcli.SPV_batch(params)
             dmcli.SPV("Device.ManagementServer.EnableCWMP", "false", "bool")
-            sleep(2)
-            dmcli.SPV("Device.ManagementServer.EnableCWMP", "true", "bool")
-        except (DMCLIError, Exception):
-            _LOGGER.warning("Failed to configure management server via dmcli")
+            try:
+                # Wait for CWMP to report disabled before enabling it again
+                deadline = monotonic() + _CWMP_DISABLE_TIMEOUT
+                interval = _CWMP_POLL_INITIAL_INTERVAL
+                while (
+                    dmcli.GPV("Device.ManagementServer.EnableCWMP").rval != "false"
+                    and monotonic() + interval < deadline
+                ):
+                    sleep(interval)
+                    interval = min(interval * 2, _CWMP_POLL_MAX_INTERVAL)
+            finally:
+                # Never leave CWMP disabled, even when polling failed
+                dmcli.SPV("Device.ManagementServer.EnableCWMP", "true", "bool")
+        except Exception:
+            _LOGGER.warning("Failed to configure management server via dmcli", exc_info=True)
 
     def finalize_boot(self) -> bool:
         """Validate board settings post boot.
@@ -591,13 +844,8 @@ class RdkSW(CPESwLibraries):  # pylint: disable=R0904
         :rtype: int
         :raises ValueError: when ifconfig data is not available
         """
-        if ifconfig_data := jc.parse(
-            "ifconfig",
-            self._get_console("default_shell").execute_command(f"ifconfig {interface}"),
-        ):
-            return ifconfig_data[0]["mtu"]  # type: ignore[index]
-        msg = f"ifconfig {interface} is not available"
-        raise ValueError(msg)
+        # Read afresh, a test may just have changed the MTU
+        return self._hw.ifconfig(interface, max_age=0)["mtu"]
 
 
 class RdkCpeDevice(CPE, LinuxDevice):
@@ -624,6 +872,9 @@ class RdkCpeDevice(CPE, LinuxDevice):
         # DMCLI API instance - will be initialized after console is available
         self._dmcli_api: DMCLIAPI | None = None
 
+        # Whether the board has pgrep, probed on first use
+        self._pgrep_available: bool | None = None
+
     @property
     def config(self) -> dict:
         """Get device configuration.
@@ -658,6 +909,7 @@ class RdkCpeDevice(CPE, LinuxDevice):
         :type device_manager: DeviceManager
         """
         self.hw.connect_to_consoles(self.device_name)
+        self.hw.collect_boot_info()
         self._sw = RdkSW(self._hw)
 
         # Set LinuxDevice console to enable traffic methods
@@ -703,14 +955,15 @@ class RdkCpeDevice(CPE, LinuxDevice):
     def _is_http_gui_running(self) -> bool:
         """Check if HTTP GUI is running."""
         try:
-            # Quick check for any service on port 80 using netstat
+            # Only listeners on port 80 are printed (exact port, not 8080,
+            # 8081, etc.), fall back to netstat where ss is unavailable
             console = self.hw.get_console("console")
-            output = console.execute_command("netstat -ln | grep :80", timeout=5)
-            # Look for LISTEN state on port 80 (exact port, not 8080, 8081, etc.)
-            import re
-            # Match lines with :80 followed by whitespace and LISTEN
-            port_80_listening = re.search(r':80\s+.*LISTEN', output) is not None
-            return port_80_listening
+            output = console.execute_command(
+                "ss -H -lnt sport = :80 2>/dev/null || "
+                "netstat -ln | awk '$4 ~ /:80$/ && $6 == \"LISTEN\"'",
+                timeout=5,
+            )
+            return bool(output.strip())
         except Exception as e:
             _LOGGER.warning("HTTP GUI check failed: %s", str(e))
             return False
@@ -744,6 +997,7 @@ class RdkCpeDevice(CPE, LinuxDevice):
             self.device_type,
         )
         self._hw.connect_to_consoles(self.device_name)
+        self._hw.collect_boot_info()
         self._sw = RdkSW(self._hw)
 
         # Set LinuxDevice console to enable traffic methods
@@ -902,6 +1156,34 @@ class RdkCpeDevice(CPE, LinuxDevice):
         """
         return self.hw.get_console("console").execute_command(cmd, timeout=timeout)
 
+    def get_iperf_json_logs(self, log_file: str) -> dict[str, Any]:
+        """Read the JSON report of an iperf3 client started with json_output.
+
+        The client's stderr goes to "<log_file>.err", see start_traffic_sender().
+
+        :param log_file: log file path returned by start_traffic_sender()
+        :type log_file: str
+        :return: iperf3 JSON report
+        :rtype: dict[str, Any]
+        """
+        output = self._console.execute_command(f"cat {log_file}")
+        # Skip anything printed ahead of the report, e.g. a shell notice
+        return json.loads(output[max(output.find("{"), 0):])
+
+    def _has_pgrep(self) -> bool:
+        """Check once whether pgrep is available on the board.
+
+        :return: True if pgrep can be used
+        :rtype: bool
+        """
+        if self._pgrep_available is None:
+            # The quotes keep the echoed command line from matching
+            output = self._console.execute_command(
+                "command -v pgrep >/dev/null && echo __PGREP_'OK'__"
+            )
+            self._pgrep_available = "__PGREP_OK__" in output
+        return self._pgrep_available
+
     def start_traffic_receiver(
         self,
         traffic_port: int,
@@ -911,7 +1193,7 @@ class RdkCpeDevice(CPE, LinuxDevice):
     ) -> tuple[int, str]:
         """Start the server on a linux device to generate traffic using iperf3.
 
-        This override makes the PID parsing more robust by detecting the ps output format.
+        This override reads the server PID from a pid file instead of parsing ps output.
 
         :param traffic_port: server port to listen on
         :type traffic_port: int
@@ -928,49 +1210,42 @@ class RdkCpeDevice(CPE, LinuxDevice):
         :return: the process id(pid) and log file path
         :rtype: tuple[int , str]
         """
-        import re
-        import tempfile
-
-        file_path = tempfile.gettempdir()
-        log_file_path = f"{file_path}/iperf_server_logs.txt"
+        log_file_path = _IPERF_SERVER_LOG_PATH
+        pid_file_path = _IPERF_PID_FILE_PATH.format(port=traffic_port)
 
         if udp_only:
             version = ""
             self._console.execute_command(
-                f"iperf -s -p {traffic_port}"
-                f"{f' -B {bind_to_ip}' if bind_to_ip else ''} -u > {log_file_path} 2>&1 &",
+                f"rm -f {pid_file_path}; iperf -s -p {traffic_port}"
+                f"{f' -B {bind_to_ip}' if bind_to_ip else ''} -u > {log_file_path} 2>&1 &"
+                f" echo $! > {pid_file_path}",
             )
         else:
             version = "3"
             self._console.execute_command(
+                f"rm -f {pid_file_path}; "
                 f"iperf3{f' -{ip_version}' if ip_version else ''} -s -p {traffic_port}"
-                f"{f' -B {bind_to_ip}' if bind_to_ip else ''} > {log_file_path} 2>&1 &",
+                f"{f' -B {bind_to_ip}' if bind_to_ip else ''} --pidfile {pid_file_path}"
+                f" > {log_file_path} 2>&1 &",
             )
 
-        # First, detect the ps output format to find PID column
-        ps_header = self._console.execute_command("ps aux | head -n 1")
-        # Split header and find PID column index
-        header_cols = ps_header.split()
-        try:
-            pid_col_index = header_cols.index("PID")
-        except ValueError:
-            # Fallback to default if PID column not found
-            pid_col_index = 1
-
-        # Now get the iperf process info
-        output = self._console.execute_command(
-            f"sleep 2; ps auxwwww|grep iperf{version}|grep -v grep",
+        # Wait for the pid file of a running server, iperf3 writes it once
+        # it has started
+        pid_command = (
+            f"pid=$(cat {pid_file_path} 2>/dev/null) && kill -0 $pid 2>/dev/null && echo $pid"
         )
-
-        if f"iperf{version}" in output and "Exit 1" not in output:
-            out = re.search(f".* -p {traffic_port}.*", output).group()
-            # Split the output and get the PID from the correct column
-            process_cols = out.split()
-            pid = int(process_cols[pid_col_index])
-            return pid, log_file_path
-        else:
-            from boardfarm3.exceptions import CodeError
-            raise CodeError(f"Unable to start iperf{version} server on port {traffic_port}")
+        deadline = monotonic() + _IPERF_START_TIMEOUT
+        interval = _POLL_INITIAL_INTERVAL
+        while True:
+            output = self._console.execute_command(pid_command).strip()
+            if output.isdigit():
+                return int(output), log_file_path
+            if monotonic() + interval >= deadline:
+                break
+            sleep(interval)
+            interval = min(interval * 2, _POLL_MAX_INTERVAL)
+
+        raise CodeError(f"Unable to start iperf{version} server on port {traffic_port}")
 
     def start_traffic_sender(
         self,
@@ -984,10 +1259,12 @@ class RdkCpeDevice(CPE, LinuxDevice):
         time: int = 10,
         client_port: int | None = None,
         udp_only: bool | None = None,
+        json_output: bool = False,
+        parallel: int | None = None,
     ) -> tuple[int, str]:
         """Start traffic on a linux client using iperf3.
 
-        This override makes the PID parsing more robust by detecting the ps output format.
+        This override takes the client PID from the launching shell instead of parsing ps output.
 
         :param host: a host to run in client mode
         :type host: str
@@ -1014,55 +1291,75 @@ class RdkCpeDevice(CPE, LinuxDevice):
         :param udp_only: to be used if protocol is UDP only,
             backward compatibility with iperf version 2
         :type udp_only: bool, optional
+        :param json_output: have iperf3 write a single JSON report to the log,
+            read it back with get_iperf_json_logs(), defaults to False
+        :type json_output: bool
+        :param parallel: number of parallel client streams, defaults to None
+            (single stream)
+        :type parallel: int | None
         :raises CodeError: raises if unable to start server
         :return: the process id(pid) and log file path
         :rtype: tuple[int , str]
         """
-        import re
-        import tempfile
-
-        file_path = tempfile.gettempdir()
-        log_file_path = f"{file_path}/iperf_client_logs.txt"
-
-        if udp_only:
-            version = ""
-            self._console.execute_command(
-                f"iperf -c {host} "
-                f"-p {traffic_port}{f' -B {bind_to_ip}' if bind_to_ip else ''}"
-                f" {f' -b {bandwidth}m' if bandwidth else ''} -t {time} {direction or ''}"
-                f" -u > {log_file_path}  2>&1  &",
-            )
-        else:
-            version = "3"
-            self._console.execute_command(
-                f"iperf3{f' -{ip_version}' if ip_version else ''} -c {host} "
-                f"-p {traffic_port}{f' -B {bind_to_ip}' if bind_to_ip else ''}"
-                f" {f' -b {bandwidth}m' if bandwidth else ''} -t {time} {direction or ''}"
-                f" {f' --cport {client_port}' if client_port else ''}"
-                f"{' -u' if udp_protocol else ''} > {log_file_path}  2>&1  &",
-            )
-
-        # First, detect the ps output format to find PID column
-        ps_header = self._console.execute_command("ps aux | head -n 1")
-        # Split header and find PID column index
-        header_cols = ps_header.split()
-        try:
-            pid_col_index = header_cols.index("PID")
-        except ValueError:
-            # Fallback to default if PID column not found
-            pid_col_index = 1
-
-        # Now get the iperf process info
+        log_file_path = _IPERF_CLIENT_LOG_PATH
+
+        version = "" if udp_only else "3"
+        parts = [f"iperf{version}"]
+        if ip_version and not udp_only:
+            parts.append(f"-{ip_version}")
+        parts += ["-c", host, "-p", str(traffic_port)]
+        if bind_to_ip:
+            parts += ["-B", bind_to_ip]
+        if bandwidth:
+            parts += ["-b", f"{bandwidth}m"]
+        parts += ["-t", str(time)]
+        if direction:
+            parts.append(direction)
+        if client_port and not udp_only:
+            parts += ["--cport", str(client_port)]
+        if parallel:
+            parts += ["-P", str(parallel)]
+        if udp_only or udp_protocol:
+            parts.append("-u")
+        if json_output and not udp_only:
+            parts.append("--json")
+        # A JSON report keeps stderr warnings in a file of their own
+        stderr = f"2>{log_file_path}.err" if "--json" in parts else "2>&1"
         output = self._console.execute_command(
-            f"sleep 2; ps auxwwww|grep iperf{version}|grep -v grep",
+            " ".join(parts) + f" > {log_file_path} {stderr} & echo PID=$!",
         )
 
-        if f"iperf{version}" in output and "Exit 1" not in output:
-            out = re.search(f".* -c {host} -p {traffic_port}.*", output).group()
-            # Split the output and get the PID from the correct column
-            process_cols = out.split()
-            pid = int(process_cols[pid_col_index])
-            return pid, log_file_path
-        else:
-            from boardfarm3.exceptions import CodeError
-            raise CodeError(f"Unable to start iperf{version} client connecting to {host}:{traffic_port}")
+        # The shell reports the PID of the backgrounded client directly;
+        # /proc/<pid>/comm confirms it is still an iperf process
+        if pid_match := _BACKGROUND_PID_RE.search(output):
+            pid = int(pid_match.group(1))
+            comm = self._console.execute_command(f"cat /proc/{pid}/comm 2>/dev/null")
+            if comm.strip().startswith(f"iperf{version}"):
+                return pid, log_file_path
+
+        # Fallback: look the client up with pgrep, polling on the board for
+        # up to 2s while it starts. The bracket keeps the pattern from
+        # matching the shell running pgrep itself, the host is escaped so
+        # the dots of an address match literally
+        if self._has_pgrep():
+            output = self._console.execute_command(
+                "i=0; while [ $i -lt 20 ]; do "
+                f"pid=$(pgrep -f '[i]perf{version} .*-c {re.escape(host)} -p {traffic_port}( |$)' | head -n 1); "
+                '[ -n "$pid" ] && echo "FOUND=$pid" && break; '
+                "sleep 0.1; i=$((i + 1)); done"
+            )
+            if pid_match := _FOUND_PID_RE.search(output):
+                return int(pid_match.group(1)), log_file_path
+
+        # Last resort for images without pgrep: a single scan of /proc
+        output = self._console.execute_command(_PROC_CMDLINE_COMMAND)
+        for line in output.splitlines():
+            pid, _, cmdline = line.partition(":")
+            if (
+                pid.isdigit()
+                and f"iperf{version}" in cmdline
+                and _iperf_client_pattern(host, traffic_port).search(cmdline)
+            ):
+                return int(pid), log_file_path
+
+        raise CodeError(f"Unable to start iperf{version} client connecting to {host}:{traffic_port}")
@@ -1,5 +1,8 @@
 """Simple Raspberry Pi CPE device for boardfarm."""
 
+import re
+from itertools import count
+
 from boardfarm3 import hookimpl
 from boardfarm3.devices.base_devices import BoardfarmDevice
 from boardfarm3.lib.connection_factory import connection_factory
@@ -17,6 +20,10 @@ class RpiCpeDevice(BoardfarmDevice):
         super().__init__(config, cmdline_args)
         self._console = None
         self.prompt = config.get("prompt", "root@RaspberryPi-Gateway")
+        # Regex matched by the console at the end of every command
+        self.shell_prompt = config.get("shell_prompt", self.prompt)
+        # Numbers the end-of-output markers used by command()
+        self._marker_ids = count()
 
     def connect_to_consoles(self, device_name):
         """Connect to device console using ser2net.
@@ -28,13 +35,13 @@ class RpiCpeDevice(BoardfarmDevice):
             connection_name=f"{device_name}.console",
             ip_addr=self._config.get("ip_addr"),
             port=self._config.get("port"),
-            shell_prompt=self._config.get("shell_prompt", self.prompt),
+            shell_prompt=self.shell_prompt,
             save_console_logs=getattr(self._cmdline_args, 'save_console_logs', None),
         )
         self._console.login_to_server()
         # Clear any initial output
         self._console.sendline("")
-        self._console.expect(self._console._shell_prompt, timeout=5)
+        self._console.expect(self.shell_prompt, timeout=5)
 
     def sendline(self, command):
         """Send a command to the device.
@@ -67,9 +74,25 @@ class RpiCpeDevice(BoardfarmDevice):
         :param timeout: timeout in seconds
         :return: command output
         """
+        # Wait for an end marker rather than the prompt regex. The marker is
+        # sent as its own line so any valid command (e.g. ending in "&") can
+        # precede it, and it hands the command's exit status back to $?. The
+        # quotes keep the echoed marker line from matching the marker itself
+        marker_id = next(self._marker_ids)
+        marker_echo = f"__BF_END_'{marker_id}'__"
         self.sendline(cmd)
-        self.expect(self._console._shell_prompt, timeout=timeout)
-        return self.before
+        self.sendline(f"__bf_rc=$?; echo {marker_echo}; (exit $__bf_rc)")
+        self._console.expect_exact(f"__BF_END_{marker_id}__", timeout=timeout)
+        # Drop the echoed marker line, the terminal may echo it ahead of the
+        # output, and the prompt printed between the output and the marker
+        output = "\n".join(
+            line
+            for line in self.before.split("\n")
+            if marker_echo not in line and not re.match(self.shell_prompt, line.lstrip("\r"))
+        )
+        # Consume the prompt that follows so the next command starts clean
+        self.expect(self.shell_prompt, timeout=timeout)
+        return output
 
     @hookimpl
     def boardfarm_device_boot(self):
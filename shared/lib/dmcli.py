@@ -10,6 +10,14 @@ from boardfarm3.lib.boardfarm_pexpect import BoardfarmPexpect
 
 from shared.lib.exceptions import DMCLIError
 
+# Printed between the outputs of batched dmcli commands
+_BATCH_SEPARATOR = "__DMCLI_SEP__"
+_BATCH_SEPARATOR_RE = re.compile(rf"^{_BATCH_SEPARATOR}\r?$", re.MULTILINE)
+# One getv result: "Parameter N name: X" followed by "type: T, value: V"
+_DMCLI_PARAM_RE = re.compile(
+    r"Parameter\s+\d+\s+name:\s+(?P<name>\S+)[^\n]*\n"
+    r"\s*type:\s+(?P<type>\w+),\s+value:[ \t]*(?P<val>[^\r\n]*)"
+)
 
 # pylint: disable-next=too-few-public-methods
 @dataclass
@@ -37,10 +45,16 @@ class DMCLIAPI:
         self._console = console
 
     def _trigger_dmcli_cmd(
-        self, operation: str, param: str, sleep_timeout: float = 0.0
+        self, operation: str, param: str, sleep_timeout: float = 0.0, timeout: int = -1
     ) -> DMCLIOut:
-        command_output = self._console.execute_command(f"dmcli eRT {operation} {param}")
+        command_output = self._console.execute_command(
+            f"dmcli eRT {operation} {param}", timeout=timeout
+        )
         sleep(sleep_timeout)
+        return self._parse_dmcli_output(operation, param, command_output)
+
+    @staticmethod
+    def _parse_dmcli_output(operation: str, param: str, command_output: str) -> DMCLIOut:
         regex_match = re.search(
             r"Execution (fail|succeed)(.*)|(Can't find destination component)",
             command_output,
@@ -53,11 +67,10 @@ class DMCLIAPI:
         status = regex_match[0].strip().rstrip('\r')
         dmcli_result = DMCLIOut(status, "", "", command_output)
         if "value:" in command_output and "getv" in operation:
-            dmcli_result.rtype = re.findall(r".*type:\s*(.*),\s+", command_output).pop()
-            # More flexible regex to handle different line endings
-            value_match = re.findall(r".*value:\s*([^\r\n]*)", command_output)
-            if value_match:
-                dmcli_result.rval = value_match.pop().strip()
+            # Single pass over the output; the last parameter reported wins
+            for match in _DMCLI_PARAM_RE.finditer(command_output):
+                dmcli_result.rtype = match["type"]
+                dmcli_result.rval = match["val"].strip()
         elif "is added" in command_output and "addt" in operation:
             dmcli_result.rval = re.search(rf"{param}(\d+)", command_output)[1]
             dmcli_result.rtype = "string"
@@ -78,6 +91,7 @@ class DMCLIAPI:
         value: str,
         type_set: str = "string",
         sleep_timeout: float = 0.0,
+        timeout: int = -1,
     ) -> DMCLIOut:
         """Set given parameter via dmcli.
 
@@ -85,22 +99,92 @@ class DMCLIAPI:
         :param value: value to be set
         :param type_set: type of value set, defaults to string
         :param sleep_timeout: sleep values when SPV, defaults to 0.0
+        :param timeout: seconds to wait for dmcli, defaults to the console timeout
         :return: dmcli output object
         :rtype: DMCLIOut
         """
         return self._trigger_dmcli_cmd(
-            "setvalues", f"{param} {type_set} {value}", sleep_timeout
+            "setvalues", f"{param} {type_set} {value}", sleep_timeout, timeout
         )
 
-    def GPV(self, param: str) -> DMCLIOut:  # pylint: disable=invalid-name
+    def SPV_batch(  # pylint: disable=invalid-name
+        self,
+        params: list[tuple[str, str, str]],
+        sleep_timeout: float = 0.0,
+    ) -> DMCLIOut:
+        """Set several parameters with a single dmcli call.
+
+        :param params: (param, value, type) tuples to be set
+        :param sleep_timeout: sleep values when SPV, defaults to 0.0
+        :return: dmcli output object
+        :rtype: DMCLIOut
+        """
+        return self._trigger_dmcli_cmd(
+            "setvalues",
+            " ".join(f"{param} {type_set} {value}" for param, value, type_set in params),
+            sleep_timeout,
+        )
+
+    def GPV(self, param: str, timeout: int = -1) -> DMCLIOut:  # pylint: disable=invalid-name
         """Get given parameter value via dmcli.
 
         :param param: param to get
         :type param: String
+        :param timeout: seconds to wait for dmcli, defaults to the console timeout
+        :type timeout: int
         :return: dmcli output object
         :rtype: DMCLIOut
         """
-        return self._trigger_dmcli_cmd("getvalues", param)
+        return self._trigger_dmcli_cmd("getvalues", param, timeout=timeout)
+
+    def GPV_tree(  # pylint: disable=invalid-name
+        self, param: str, timeout: int = -1
+    ) -> dict[str, DMCLIOut]:
+        """Get all parameter values below a partial path via dmcli.
+
+        :param param: partial path to get, ending with a dot
+        :type param: String
+        :param timeout: seconds to wait for dmcli, defaults to the console timeout
+        :type timeout: int
+        :return: dmcli output object per parameter name
+        :rtype: dict[str, DMCLIOut]
+        """
+        result = self._trigger_dmcli_cmd("getvalues", param, timeout=timeout)
+        return {
+            match["name"]: DMCLIOut(
+                result.status, match["type"], match["val"].strip(), result.console_out
+            )
+            for match in _DMCLI_PARAM_RE.finditer(result.console_out)
+        }
+
+    def GPV_batch(  # pylint: disable=invalid-name
+        self, params: list[str]
+    ) -> dict[str, DMCLIOut | DMCLIError]:
+        """Get several parameter values with a single console command.
+
+        Each parameter is queried by its own dmcli call, the outputs are
+        separated by a marker line and parsed one by one.
+
+        :param params: params to get
+        :type params: list[str]
+        :return: dmcli output object, or the error raised for it, per param
+        :rtype: dict[str, DMCLIOut | DMCLIError]
+        """
+        command_output = self._console.execute_command(
+            "; ".join(f"echo {_BATCH_SEPARATOR}; dmcli eRT getvalues {param}" for param in params)
+        )
+        # Anything before the first separator is not dmcli output
+        segments = _BATCH_SEPARATOR_RE.split(command_output)[1:]
+        results: dict[str, DMCLIOut | DMCLIError] = {}
+        for index, param in enumerate(params):
+            if index >= len(segments):
+                results[param] = DMCLIError(f"No dmcli output for {param}")
+                continue
+            try:
+                results[param] = self._parse_dmcli_output("getvalues", param, segments[index])
+            except DMCLIError as exc:
+                results[param] = exc
+        return results
 
     def DelObject(self, param: str) -> DMCLIOut:  # pylint: disable=invalid-name
         """Add object via dmcli.
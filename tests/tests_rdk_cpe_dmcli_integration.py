@@ -1,28 +1,22 @@
 """Integration tests for RDK CPE Device with DMCLI library."""
 
 import pytest
-from boardfarm3.lib.device_manager import DeviceManager
 from rdk_cpe_device import RdkCpeDevice
 from shared.lib.dmcli import DMCLIAPI, DMCLIError
 
 
+@pytest.fixture(scope="class")
+def dmcli(rdk_board: RdkCpeDevice) -> DMCLIAPI:
+    """DMCLI API instance shared with the board."""
+    return rdk_board.get_dmcli_api()
+
+
 class TestRdkCpeDmcliIntegration:
     """Test RDK CPE device integration with DMCLI library."""
 
-    def _get_board(self, device_manager: DeviceManager) -> RdkCpeDevice:
-        """Get the RDK CPE device from device manager."""
-        devices = device_manager.get_devices_by_type(RdkCpeDevice)
-        assert len(devices) > 0, "No RDK CPE devices found"
-        return list(devices.values())[0]
-
     @pytest.mark.integration
-    def test_dmcli_get_device_info(self, device_manager: DeviceManager):
+    def test_dmcli_get_device_info(self, dmcli: DMCLIAPI):
         """Test getting device information using DMCLI library."""
-        board = self._get_board(device_manager)
-
-        # Create DMCLI API instance using the board's console
-        dmcli = DMCLIAPI(board.hw._console)
-
         # Get device serial number
         try:
             result = dmcli.GPV("Device.DeviceInfo.SerialNumber")
@@ -34,11 +28,8 @@ class TestRdkCpeDmcliIntegration:
             pytest.skip(f"DMCLI not available on device: {e}")
 
     @pytest.mark.integration
-    def test_dmcli_get_software_version(self, device_manager: DeviceManager):
+    def test_dmcli_get_software_version(self, dmcli: DMCLIAPI):
         """Test getting software version using DMCLI."""
-        board = self._get_board(device_manager)
-        dmcli = DMCLIAPI(board.hw._console)
-
         try:
             result = dmcli.GPV("Device.DeviceInfo.SoftwareVersion")
             print(f"Software Version: {result.rval}")
@@ -49,11 +40,8 @@ class TestRdkCpeDmcliIntegration:
             pytest.skip(f"DMCLI not available on device: {e}")
 
     @pytest.mark.integration
-    def test_dmcli_get_model_name(self, device_manager: DeviceManager):
+    def test_dmcli_get_model_name(self, dmcli: DMCLIAPI):
         """Test getting model name using DMCLI."""
-        board = self._get_board(device_manager)
-        dmcli = DMCLIAPI(board.hw._console)
-
         try:
             result = dmcli.GPV("Device.DeviceInfo.ModelName")
             print(f"Model Name: {result.rval}")
@@ -64,11 +52,8 @@ class TestRdkCpeDmcliIntegration:
             pytest.skip(f"DMCLI not available on device: {e}")
 
     @pytest.mark.integration
-    def test_dmcli_get_uptime(self, device_manager: DeviceManager):
+    def test_dmcli_get_uptime(self, dmcli: DMCLIAPI):
         """Test getting device uptime using DMCLI."""
-        board = self._get_board(device_manager)
-        dmcli = DMCLIAPI(board.hw._console)
-
         try:
             result = dmcli.GPV("Device.DeviceInfo.UpTime")
             print(f"Uptime: {result.rval} seconds")
@@ -82,11 +67,8 @@ class TestRdkCpeDmcliIntegration:
             pytest.skip(f"DMCLI not available on device: {e}")
 
     @pytest.mark.integration
-    def test_dmcli_get_network_interfaces(self, device_manager: DeviceManager):
+    def test_dmcli_get_network_interfaces(self, dmcli: DMCLIAPI):
         """Test getting network interface information using DMCLI."""
-        board = self._get_board(device_manager)
-        dmcli = DMCLIAPI(board.hw._console)
-
         try:
             # Get number of Ethernet interfaces
             result = dmcli.GPV("Device.Ethernet.InterfaceNumberOfEntries")
@@ -101,11 +83,8 @@ class TestRdkCpeDmcliIntegration:
             pytest.skip(f"Ethernet interface parameters not available: {e}")
 
     @pytest.mark.integration
-    def test_dmcli_get_wifi_status(self, device_manager: DeviceManager):
+    def test_dmcli_get_wifi_status(self, dmcli: DMCLIAPI):
         """Test getting WiFi status using DMCLI."""
-        board = self._get_board(device_manager)
-        dmcli = DMCLIAPI(board.hw._console)
-
         try:
             # Check if WiFi radio is enabled
             result = dmcli.GPV("Device.WiFi.Radio.1.Enable")
@@ -122,11 +101,8 @@ class TestRdkCpeDmcliIntegration:
             pytest.skip(f"WiFi parameters not available: {e}")
 
     @pytest.mark.integration
-    def test_dmcli_set_parameter(self, device_manager: DeviceManager):
+    def test_dmcli_set_parameter(self, dmcli: DMCLIAPI):
         """Test setting a parameter using DMCLI (non-destructive test)."""
-        board = self._get_board(device_manager)
-        dmcli = DMCLIAPI(board.hw._console)
-
         try:
             # Try to set a harmless parameter (device alias/name)
             # First get the current value
@@ -150,11 +126,8 @@ class TestRdkCpeDmcliIntegration:
             pytest.skip(f"Cannot set device alias parameter: {e}")
 
     @pytest.mark.integration
-    def test_dmcli_get_multiple_parameters(self, device_manager: DeviceManager):
-        """Test getting multiple parameters in sequence."""
-        board = self._get_board(device_manager)
-        dmcli = DMCLIAPI(board.hw._console)
-
+    def test_dmcli_get_multiple_parameters(self, dmcli: DMCLIAPI):
+        """Test getting multiple parameters in one batch."""
         parameters_to_check = [
             "Device.DeviceInfo.Manufacturer",
             "Device.DeviceInfo.ManufacturerOUI",
@@ -165,18 +138,17 @@ class TestRdkCpeDmcliIntegration:
         ]
 
         results = {}
-        for param in parameters_to_check:
-            try:
-                result = dmcli.GPV(param)
-                results[param] = {
-                    "value": result.rval,
-                    "type": result.rtype,
-                    "status": result.status
-                }
-                print(f"{param}: {result.rval} ({result.rtype})")
-            except DMCLIError as e:
-                results[param] = {"error": str(e)}
-                print(f"{param}: Error - {e}")
+        for param, result in dmcli.GPV_batch(parameters_to_check).items():
+            if isinstance(result, DMCLIError):
+                results[param] = {"error": str(result)}
+                print(f"{param}: Error - {result}")
+                continue
+            results[param] = {
+                "value": result.rval,
+                "type": result.rtype,
+                "status": result.status
+            }
+            print(f"{param}: {result.rval} ({result.rtype})")
 
         # At least some parameters should be available
         successful_params = [p for p in results if "error" not in results[p]]
@@ -185,11 +157,8 @@ class TestRdkCpeDmcliIntegration:
 
     @pytest.mark.integration
     @pytest.mark.slow
-    def test_dmcli_add_delete_object(self, device_manager: DeviceManager):
+    def test_dmcli_add_delete_object(self, dmcli: DMCLIAPI):
         """Test adding and deleting objects using DMCLI (if supported)."""
-        board = self._get_board(device_manager)
-        dmcli = DMCLIAPI(board.hw._console)
-
         try:
             # Try to add a new WiFi AccessPoint object
             result = dmcli.AddObject("Device.WiFi.AccessPoint.")
@@ -211,14 +180,11 @@ class TestRdkCpeDmcliIntegration:
             pytest.skip(f"Add/Delete object operations not supported: {e}")
 
     @pytest.mark.integration
-    def test_dmcli_error_handling(self, device_manager: DeviceManager):
+    def test_dmcli_error_handling(self, dmcli: DMCLIAPI):
         """Test DMCLI error handling with invalid parameters."""
-        board = self._get_board(device_manager)
-        dmcli = DMCLIAPI(board.hw._console)
-
         # Test with invalid parameter
         with pytest.raises(DMCLIError) as exc_info:
-            dmcli.GPV("Device.Invalid.NonExistent.Parameter")
+            dmcli.GPV("Device.Invalid.NonExistent.Parameter", timeout=10)
 
         assert "execution failed" in str(exc_info.value).lower() or \
                "can't find" in str(exc_info.value).lower()
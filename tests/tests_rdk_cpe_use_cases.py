@@ -5,167 +5,259 @@ CPE device testing, including system monitoring, networking validation,
 and service status checks.
 """
 
+import contextlib
+import logging
+import os
+import re
+from collections.abc import Callable, Iterator
+from itertools import chain
+from typing import Any
+
 import pytest
-from boardfarm3.lib.device_manager import DeviceManager
 from boardfarm3.use_cases import cpe as cpe_use_cases
 from boardfarm3.use_cases import iperf as iperf_use_cases
 from boardfarm3.use_cases import networking as networking_use_cases
 from rdk_cpe_device import RdkCpeDevice
 
+_LOGGER = logging.getLogger(__name__)
+
+
+# Board metrics read by the use cases, gathered in one console round trip.
+# Each section is introduced by a marker line parsed by _collect_health()
+_HEALTH_COMMAND = (
+    "echo __CPU__; cut -d' ' -f1 /proc/loadavg; "
+    "echo __MEM__; free -m; "
+    "echo __UP__; cat /proc/uptime; "
+    "echo __END__"
+)
+_HEALTH_SECTION_RE = re.compile(r"^__(\w+)__\r?$", re.MULTILINE)
+# Same patterns as CPESwLibraries.get_memory_utilization/get_seconds_uptime
+_MEMORY_RE = re.compile(r"Mem:\s+((\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+))")
+_MEMORY_KEYS = ("total", "used", "free", "shared", "cache", "available")
+_UPTIME_RE = re.compile(r"((\d+)\.(\d{2}))(\s)(\d+)\.(\d{2})")
+
+# Replies counted in the ping summary, iputils "1 received" or busybox
+# "1 packets received"
+_PING_RE = re.compile(r"(\d+) (?:packets )?received")
 
-class TestRdkCpeUseCases:
-    """Test RDK CPE device using boardfarm3 use cases."""
+# Throughput reported by iperf, e.g. "94.1 Mbits/sec"
+_BITS_SEC = "bits/sec"
+_BW_RE = re.compile(r"([0-9.]+)\s+([KMGT]?)bits/sec")
 
-    def _get_board(self, device_manager: DeviceManager) -> RdkCpeDevice:
-        """Get the RDK CPE device from device manager."""
-        devices = device_manager.get_devices_by_type(RdkCpeDevice)
-        assert len(devices) > 0, "No RDK CPE devices found"
-        return list(devices.values())[0]
 
-    @pytest.mark.integration
-    def test_cpu_usage_monitoring(self, device_manager: DeviceManager):
-        """Test CPU usage monitoring using boardfarm use case.
+def _parse_memory(output: str) -> dict[str, int]:
+    """Parse "free -m" output like the get_memory_usage use case."""
+    if (regex_match := _MEMORY_RE.search(output)) is None:
+        raise ValueError(f"Failed to get the memory usage from: {output!r}")
+    return dict(zip(_MEMORY_KEYS, map(int, regex_match.group(1).split())))
 
-        This test demonstrates how to use the get_cpu_usage use case
-        to monitor system performance.
-        """
-        board = self._get_board(device_manager)
 
-        # Use boardfarm use case to get CPU usage
-        cpu_usage = cpe_use_cases.get_cpu_usage(board)
+def _parse_uptime(output: str) -> float:
+    """Parse /proc/uptime like the get_seconds_uptime use case."""
+    if (regex_match := _UPTIME_RE.search(output)) is None:
+        raise ValueError("Failed to get the uptime")
+    return float(regex_match[1])
 
-        # Validate CPU usage is reasonable (between 0-100%)
-        assert isinstance(cpu_usage, (int, float)), "CPU usage should be numeric"
-        assert 0.0 <= cpu_usage <= 100.0, f"CPU usage {cpu_usage}% should be between 0-100%"
 
-        print(f"Current CPU usage: {cpu_usage}%")
+# Metrics parsed from the _HEALTH_COMMAND output: key, section, parser
+_HEALTH_SECTIONS: tuple[tuple[str, str, Callable[[str], Any]], ...] = (
+    ("cpu_usage", "CPU", float),
+    ("memory_info", "MEM", _parse_memory),
+    ("uptime_seconds", "UP", _parse_uptime),
+)
+# Metrics read through their use case: key, use case
+_HEALTH_USE_CASES: tuple[tuple[str, Callable[[RdkCpeDevice], Any]], ...] = (
+    ("provisioning_mode", cpe_use_cases.get_cpe_provisioning_mode),
+    ("tr069_running", cpe_use_cases.is_tr069_agent_running),
+    ("ntp_synced", cpe_use_cases.is_ntp_synchronized),
+)
 
-    @pytest.mark.integration
-    def test_memory_usage_monitoring(self, device_manager: DeviceManager):
-        """Test memory usage monitoring using boardfarm use case.
 
-        This test demonstrates how to use the get_memory_usage use case
-        to monitor system memory utilization.
-        """
-        board = self._get_board(device_manager)
+def _safe_call(func: Callable[[Any], Any], arg: Any) -> tuple[bool, Any]:
+    """Call func with arg, turning an exception into its message.
 
-        # Use boardfarm use case to get memory usage
-        memory_info = cpe_use_cases.get_memory_usage(board)
+    :return: (True, result) on success, (False, error message) on failure
+    """
+    try:
+        return True, func(arg)
+    except Exception as e:
+        return False, str(e)
 
-        # Validate memory info structure
-        assert isinstance(memory_info, dict), "Memory info should be a dictionary"
 
-        # Check for common memory fields
-        expected_fields = ["total", "used", "free"]
-        for field in expected_fields:
-            if field in memory_info:
-                assert isinstance(memory_info[field], int), f"{field} should be an integer"
-                assert memory_info[field] >= 0, f"{field} should be non-negative"
+def _collect_health(board: RdkCpeDevice) -> tuple[dict[str, Any], dict[str, str]]:
+    """Collect the system health metrics of the board.
 
-        print(f"Memory usage: {memory_info}")
+    The console based metrics are read with a single command. Provisioning
+    mode, TR069 and NTP status go through their use cases, which need no
+    extra console round trip on this device.
 
-    @pytest.mark.integration
-    def test_system_uptime_monitoring(self, device_manager: DeviceManager):
-        """Test system uptime monitoring using boardfarm use case.
+    :param board: RDK CPE device
+    :return: values of the metrics read, error messages of the failed ones
+    """
+    output = board.command(_HEALTH_COMMAND, timeout=30)
+    # Only whole marker lines split, not the echoed command line
+    parts = _HEALTH_SECTION_RE.split(output)
+    sections = dict(zip(parts[1::2], (part.strip() for part in parts[2::2])))
 
-        This test demonstrates how to use the get_seconds_uptime use case
-        to check system stability.
-        """
-        board = self._get_board(device_manager)
+    # A missing section reaches its parser as None and fails there
+    calls = chain(
+        ((key, parse, sections.get(section)) for key, section, parse in _HEALTH_SECTIONS),
+        ((key, use_case, board) for key, use_case in _HEALTH_USE_CASES),
+    )
+    health_report: dict[str, Any] = {}
+    errors: dict[str, str] = {}
+    for key, read_metric, arg in calls:
+        succeeded, value = _safe_call(read_metric, arg)
+        (health_report if succeeded else errors)[key] = value
+    return health_report, errors
 
-        # Use boardfarm use case to get uptime in seconds
-        uptime_seconds = cpe_use_cases.get_seconds_uptime(board)
 
-        # Validate uptime
-        assert isinstance(uptime_seconds, (int, float)), "Uptime should be numeric"
-        assert uptime_seconds > 0, "Uptime should be positive"
+def _validate_cpu_usage(cpu_usage: Any) -> None:
+    """Validate CPU usage is reasonable (between 0-100%)."""
+    assert isinstance(cpu_usage, (int, float)), "CPU usage should be numeric"
+    assert 0.0 <= cpu_usage <= 100.0, f"CPU usage {cpu_usage}% should be between 0-100%"
+
+    _LOGGER.info("Current CPU usage: %s%%", cpu_usage)
+
+
+def _validate_memory_usage(memory_info: Any) -> None:
+    """Validate the memory info structure and its common fields."""
+    assert isinstance(memory_info, dict), "Memory info should be a dictionary"
+
+    for field in ("total", "used", "free"):
+        if field in memory_info:
+            assert isinstance(memory_info[field], int), f"{field} should be an integer"
+            assert memory_info[field] >= 0, f"{field} should be non-negative"
+
+    _LOGGER.info("Memory usage: %s", memory_info)
+
+
+def _validate_uptime(uptime_seconds: Any) -> None:
+    """Validate uptime and print it in human readable format."""
+    assert isinstance(uptime_seconds, (int, float)), "Uptime should be numeric"
+    assert uptime_seconds > 0, "Uptime should be positive"
 
-        # Convert to human readable format
-        hours = uptime_seconds // 3600
-        minutes = (uptime_seconds % 3600) // 60
+    hours = uptime_seconds // 3600
+    minutes = (uptime_seconds % 3600) // 60
 
-        print(f"System uptime: {uptime_seconds:.1f} seconds ({hours:.0f}h {minutes:.0f}m)")
+    _LOGGER.info("System uptime: %.1f seconds (%.0fh %.0fm)", uptime_seconds, hours, minutes)
 
-    @pytest.mark.integration
-    def test_provisioning_mode_check(self, device_manager: DeviceManager):
-        """Test CPE provisioning mode using boardfarm use case.
 
-        This test demonstrates how to use the get_cpe_provisioning_mode use case
-        to verify device configuration.
-        """
-        board = self._get_board(device_manager)
+def _validate_provisioning_mode(provisioning_mode: Any) -> None:
+    """Validate provisioning mode, standard modes are reported."""
+    assert isinstance(provisioning_mode, str), "Provisioning mode should be a string"
+    assert len(provisioning_mode) > 0, "Provisioning mode should not be empty"
+
+    _LOGGER.info("Provisioning mode: %s", provisioning_mode)
 
-        # Use boardfarm use case to get provisioning mode
-        provisioning_mode = cpe_use_cases.get_cpe_provisioning_mode(board)
+    # This is informational - different devices may have different valid modes
+    if provisioning_mode.lower() in ("ipv4", "ipv6", "dual", "bridge"):
+        _LOGGER.info("✓ Standard provisioning mode detected: %s", provisioning_mode)
+
+
+def _validate_tr069_status(is_tr069_running: Any) -> None:
+    """Validate TR069 status, running or not depends on configuration."""
+    assert isinstance(is_tr069_running, bool), "TR069 status should be boolean"
+
+    _LOGGER.info("TR069 agent running: %s", is_tr069_running)
+
+    if is_tr069_running:
+        _LOGGER.info("✓ TR069 management agent is active")
+    else:
+        _LOGGER.info("ℹ TR069 management agent is not running (may be expected)")
 
-        # Validate provisioning mode
-        assert isinstance(provisioning_mode, str), "Provisioning mode should be a string"
-        assert len(provisioning_mode) > 0, "Provisioning mode should not be empty"
 
-        # Check for expected modes
-        valid_modes = ["ipv4", "ipv6", "dual", "bridge"]
-        print(f"Provisioning mode: {provisioning_mode}")
+def _validate_ntp_status(is_ntp_synced: Any) -> None:
+    """Validate NTP status, sync depends on network access and configuration."""
+    assert isinstance(is_ntp_synced, bool), "NTP sync status should be boolean"
 
-        # This is informational - different devices may have different valid modes
-        if provisioning_mode.lower() in valid_modes:
-            print(f"✓ Standard provisioning mode detected: {provisioning_mode}")
+    _LOGGER.info("NTP synchronized: %s", is_ntp_synced)
 
-    @pytest.mark.integration
-    def test_tr069_agent_status(self, device_manager: DeviceManager):
-        """Test TR069 agent status using boardfarm use case.
+    if is_ntp_synced:
+        _LOGGER.info("✓ System time is synchronized via NTP")
+    else:
+        _LOGGER.info("ℹ System time is not NTP synchronized (may need network access)")
 
-        This test demonstrates how to use the is_tr069_agent_running use case
-        to verify management services.
-        """
-        board = self._get_board(device_manager)
 
-        # Use boardfarm use case to check TR069 agent status
-        is_tr069_running = cpe_use_cases.is_tr069_agent_running(board)
+# Monitoring use cases and the validation of their result, run by test_use_case
+_METRIC_USE_CASES = (
+    pytest.param(cpe_use_cases.get_cpu_usage, _validate_cpu_usage, id="cpu"),
+    pytest.param(cpe_use_cases.get_memory_usage, _validate_memory_usage, id="memory"),
+    pytest.param(cpe_use_cases.get_seconds_uptime, _validate_uptime, id="uptime"),
+    pytest.param(
+        cpe_use_cases.get_cpe_provisioning_mode,
+        _validate_provisioning_mode,
+        id="provisioning_mode",
+    ),
+    pytest.param(cpe_use_cases.is_tr069_agent_running, _validate_tr069_status, id="tr069"),
+    pytest.param(cpe_use_cases.is_ntp_synchronized, _validate_ntp_status, id="ntp"),
+)
 
-        # Validate result
-        assert isinstance(is_tr069_running, bool), "TR069 status should be boolean"
 
-        print(f"TR069 agent running: {is_tr069_running}")
+@pytest.fixture(scope="session")
+def iperf3_available(rdk_board: RdkCpeDevice) -> bool:
+    """Whether iperf3 is installed on the board, probed once per session."""
+    try:
+        return "/iperf3" in rdk_board.command("command -v iperf3", timeout=5)
+    except Exception:
+        return False
 
-        # This is informational - TR069 may or may not be running depending on configuration
-        if is_tr069_running:
-            print("✓ TR069 management agent is active")
-        else:
-            print("ℹ TR069 management agent is not running (may be expected)")
 
-    @pytest.mark.integration
-    def test_ntp_synchronization_status(self, device_manager: DeviceManager):
-        """Test NTP synchronization using boardfarm use case.
+@pytest.fixture(scope="session")
+def ensure_iperf3(rdk_board: RdkCpeDevice, iperf3_available: bool) -> None:
+    """Install iperf3 on the board once per session, skip when that fails."""
+    if iperf3_available:
+        return
+    try:
+        output = rdk_board.command(
+            "(apt-get update -qq && DEBIAN_FRONTEND=noninteractive "
+            "apt-get install -y -qq --no-install-recommends iperf3) >/dev/null 2>&1; "
+            "command -v iperf3",
+            timeout=60,
+        )
+    except Exception as e:
+        pytest.skip(f"iperf3 not available: {e}")
+    if "/iperf3" not in output:
+        pytest.skip("iperf3 not available and could not be installed")
 
-        This test demonstrates how to use the is_ntp_synchronized use case
-        to verify time synchronization.
-        """
-        board = self._get_board(device_manager)
 
-        # Use boardfarm use case to check NTP synchronization
-        is_ntp_synced = cpe_use_cases.is_ntp_synchronized(board)
+@pytest.fixture
+def iperf_cleanup(rdk_board: RdkCpeDevice) -> Iterator[None]:
+    """Kill any iperf3 process left on the board once the test is done."""
+    yield
+    try:
+        rdk_board.command("pkill -f iperf3", timeout=5)
+    except Exception:
+        _LOGGER.debug("Best effort iperf3 cleanup failed", exc_info=True)
 
-        # Validate result
-        assert isinstance(is_ntp_synced, bool), "NTP sync status should be boolean"
 
-        print(f"NTP synchronized: {is_ntp_synced}")
+class TestRdkCpeUseCases:
+    """Test RDK CPE device using boardfarm3 use cases."""
 
-        # This is informational - NTP sync depends on network connectivity and configuration
-        if is_ntp_synced:
-            print("✓ System time is synchronized via NTP")
-        else:
-            print("ℹ System time is not NTP synchronized (may need network access)")
+    @pytest.mark.integration
+    @pytest.mark.parametrize(("use_case", "validate"), _METRIC_USE_CASES)
+    def test_use_case(
+        self,
+        rdk_board: RdkCpeDevice,
+        use_case: Callable[[RdkCpeDevice], Any],
+        validate: Callable[[Any], None],
+    ):
+        """Test a single boardfarm monitoring use case.
+
+        Each parameter runs one use case against the board and validates
+        its result, see _METRIC_USE_CASES.
+        """
+        validate(use_case(rdk_board))
 
     @pytest.mark.integration
     @pytest.mark.slow
-    def test_ping_connectivity_use_case(self, device_manager: DeviceManager):
+    @pytest.mark.timeout(30)
+    def test_ping_connectivity_use_case(self, rdk_board: RdkCpeDevice):
         """Test network connectivity using networking use case.
 
         This test demonstrates how to use networking use cases for
         connectivity testing from the CPE device.
         """
-        board = self._get_board(device_manager)
-
         # Test ping to common public DNS servers
         test_targets = [
             "8.8.8.8",    # Google DNS
@@ -180,260 +272,204 @@ class TestRdkCpeUseCases:
                 # For demo purposes, we'll simulate the use case pattern
 
                 # In a real implementation, you would use:
-                # result = networking_use_cases.ping(board, target, ping_count=3)
+                # result = networking_use_cases.ping(rdk_board, target, ping_count=3)
 
                 # For this demo, we'll test basic network interface availability
                 # by checking if the device can execute network commands
-                result = board.command("ping -c 1 -W 5 127.0.0.1", timeout=10)
+                result = rdk_board.command("ping -c 1 -W 1 -w 2 127.0.0.1", timeout=5)
 
-                if "1 packets transmitted, 1 received" in result or "1 received" in result:
+                if (ping_match := _PING_RE.search(result)) and int(ping_match[1]) > 0:
                     successful_pings += 1
-                    print(f"✓ Basic ping functionality verified (target: {target})")
+                    _LOGGER.info("✓ Basic ping functionality verified (target: %s)", target)
+                    break
                 else:
-                    print(f"ℹ Ping test to {target} - network connectivity may be limited")
+                    _LOGGER.info("ℹ Ping test to %s - network connectivity may be limited", target)
 
             except Exception as e:
-                print(f"ℹ Ping test to {target} failed: {str(e)} - this may be expected in isolated test environment")
+                _LOGGER.info(
+                    "ℹ Ping test to %s failed: %s - this may be expected in isolated test environment",
+                    target,
+                    e,
+                )
 
         # At least basic loopback should work
         assert successful_pings >= 0, "At least basic network functionality should be available"
 
     @pytest.mark.integration
-    def test_combined_system_health_check(self, device_manager: DeviceManager):
+    def test_combined_system_health_check(self, rdk_board: RdkCpeDevice):
         """Combined system health check using multiple use cases.
 
         This test demonstrates how to combine multiple boardfarm use cases
         for a comprehensive system health assessment.
         """
-        board = self._get_board(device_manager)
-
-        health_report = {}
-
-        # Collect system metrics using multiple use cases
-        try:
-            health_report["cpu_usage"] = cpe_use_cases.get_cpu_usage(board)
-        except Exception as e:
-            health_report["cpu_usage"] = f"Error: {e}"
-
-        try:
-            health_report["memory_info"] = cpe_use_cases.get_memory_usage(board)
-        except Exception as e:
-            health_report["memory_info"] = f"Error: {e}"
-
-        try:
-            health_report["uptime_seconds"] = cpe_use_cases.get_seconds_uptime(board)
-        except Exception as e:
-            health_report["uptime_seconds"] = f"Error: {e}"
-
-        try:
-            health_report["provisioning_mode"] = cpe_use_cases.get_cpe_provisioning_mode(board)
-        except Exception as e:
-            health_report["provisioning_mode"] = f"Error: {e}"
-
-        try:
-            health_report["tr069_running"] = cpe_use_cases.is_tr069_agent_running(board)
-        except Exception as e:
-            health_report["tr069_running"] = f"Error: {e}"
-
-        try:
-            health_report["ntp_synced"] = cpe_use_cases.is_ntp_synchronized(board)
-        except Exception as e:
-            health_report["ntp_synced"] = f"Error: {e}"
+        health_report, errors = _collect_health(rdk_board)
 
         # Print comprehensive health report
-        print("\n=== System Health Report ===")
+        _LOGGER.info("=== System Health Report ===")
         for key, value in health_report.items():
-            print(f"{key}: {value}")
-        print("===========================\n")
+            _LOGGER.info("%s: %s", key, value)
+        for key, error in errors.items():
+            _LOGGER.info("%s: Error: %s", key, error)
+        _LOGGER.info("===========================")
 
         # Validate that we got at least some successful metrics
-        successful_metrics = sum(1 for value in health_report.values()
-                               if not isinstance(value, str) or not value.startswith("Error:"))
-
-        assert successful_metrics > 0, "At least one health metric should be successfully collected"
+        assert health_report, "At least one health metric should be successfully collected"
 
         # Additional health checks
-        if isinstance(health_report.get("cpu_usage"), (int, float)):
-            assert 0 <= health_report["cpu_usage"] <= 100, "CPU usage should be within valid range"
+        cpu_usage = health_report.get("cpu_usage")
+        if isinstance(cpu_usage, (int, float)):
+            assert 0 <= cpu_usage <= 100, "CPU usage should be within valid range"
 
-        if isinstance(health_report.get("uptime_seconds"), (int, float)):
-            assert health_report["uptime_seconds"] > 0, "Uptime should be positive"
+        uptime_seconds = health_report.get("uptime_seconds")
+        if isinstance(uptime_seconds, (int, float)):
+            assert uptime_seconds > 0, "Uptime should be positive"
 
     @pytest.mark.integration
-    def test_use_case_error_handling(self, device_manager: DeviceManager):
+    def test_use_case_error_handling(self, rdk_board: RdkCpeDevice):
         """Test error handling in use case implementations.
 
         This test demonstrates how use cases handle various error conditions
         and provides fallback behaviors.
         """
-        board = self._get_board(device_manager)
-
-        # Test use cases with potentially problematic scenarios
-        error_scenarios = []
-
-        # Test each use case and track any errors
-        use_case_tests = [
-            ("CPU Usage", lambda: cpe_use_cases.get_cpu_usage(board)),
-            ("Memory Usage", lambda: cpe_use_cases.get_memory_usage(board)),
-            ("Uptime", lambda: cpe_use_cases.get_seconds_uptime(board)),
-            ("Provisioning Mode", lambda: cpe_use_cases.get_cpe_provisioning_mode(board)),
-            ("TR069 Status", lambda: cpe_use_cases.is_tr069_agent_running(board)),
-            ("NTP Status", lambda: cpe_use_cases.is_ntp_synchronized(board)),
-        ]
+        # Collect every metric in one round trip and track any errors
+        health_report, errors = _collect_health(rdk_board)
 
-        for name, test_func in use_case_tests:
-            try:
-                result = test_func()
-                print(f"✓ {name}: {result}")
-            except Exception as e:
-                error_scenarios.append(f"{name}: {str(e)}")
-                print(f"✗ {name}: Error - {str(e)}")
+        for name, result in health_report.items():
+            _LOGGER.info("✓ %s: %s", name, result)
+        for name, error in errors.items():
+            _LOGGER.info("✗ %s: Error - %s", name, error)
 
         # Report error scenarios (informational)
-        if error_scenarios:
-            print(f"\nError scenarios encountered ({len(error_scenarios)} out of {len(use_case_tests)}):")
-            for error in error_scenarios:
-                print(f"  - {error}")
+        if errors:
+            total = len(health_report) + len(errors)
+            _LOGGER.info("Error scenarios encountered (%s out of %s):", len(errors), total)
+            for name, error in errors.items():
+                _LOGGER.info("  - %s: %s", name, error)
 
         # This test is primarily informational - use cases should handle errors gracefully
         # We expect at least some use cases to work
-        successful_count = len(use_case_tests) - len(error_scenarios)
-        assert successful_count > 0, "At least one use case should execute successfully"
+        assert health_report, "At least one use case should execute successfully"
 
     @pytest.mark.integration
     @pytest.mark.slow
-    def test_iperf_use_case_real(self, device_manager: DeviceManager):
+    # Leaves room for the iperf3 install in ensure_iperf3, which counts too
+    @pytest.mark.timeout(90)
+    @pytest.mark.usefixtures("ensure_iperf3", "iperf_cleanup")
+    def test_iperf_use_case_real(self, rdk_board: RdkCpeDevice):
         """Test network performance using actual boardfarm3 iperf use case.
 
         This test demonstrates the real boardfarm3 iperf use case by using
         the CPE device as both source and destination for iperf traffic testing.
         Since we now inherit from LinuxDevice, we have the traffic methods needed.
         """
-        board = self._get_board(device_manager)
-
-        print("\n=== Real Boardfarm3 iPerf Use Case Test ===")
-
-        # Check if iperf3 is available on the device
+        _LOGGER.info("=== Real Boardfarm3 iPerf Use Case Test ===")
+
+        _LOGGER.info("🚀 Running actual boardfarm3 iperf use case...")
+
+        # Since our CPE device now has LinuxDevice traffic methods,
+        # we can use it as both source and destination for iperf testing
+        # This simulates a loopback performance test
+
+        # Use the actual boardfarm3 iperf use case
+        # Note: We're using the same device as both source and destination
+        # with loopback IP to test the use case functionality
+        test_duration = 5
+        traffic_generator = iperf_use_cases.start_iperf_ipv4(
+            source_device=rdk_board,       # CPE device as source
+            destination_device=rdk_board,  # CPE device as destination
+            source_port=5201,              # Standard iperf port
+            time=test_duration,            # 5 second test
+            udp_protocol=False,            # Use TCP
+            destination_ip="127.0.0.1",    # Loopback test
+        )
+
+        _LOGGER.info("✓ iPerf traffic generator created successfully")
+        if os.getenv("BF_DEBUG"):
+            _LOGGER.info("Traffic generator: %s", vars(traffic_generator))
+
+        # Use the actual attributes available on the traffic generator
+        _LOGGER.info("Traffic generator: %s", {
+            "sender": traffic_generator.traffic_sender,
+            "receiver": traffic_generator.traffic_receiver,
+            "sender_pid": traffic_generator.sender_pid,
+            "receiver_pid": traffic_generator.receiver_pid,
+        })
+
+        # Wait for the test to complete on the board itself: the shell
+        # loops until the client exits or reports its summary, then
+        # returns the client log in the same round trip. The loop gives up
+        # after test_duration + 5 seconds, the host timeout adds slack on top
+        _LOGGER.info("⏳ Waiting for iperf test to complete...")
+        client_log_file = getattr(traffic_generator, "client_log_file", None)
+        if not client_log_file:
+            # Left over iperf3 processes are killed by the iperf_cleanup fixture
+            pytest.skip("iperf use case did not report a client log file")
+        polls = (test_duration + 5) * 5
         try:
-            result = board.command("which iperf3", timeout=10)
-            if not result.strip() or "/iperf3" not in result:
-                print("ℹ iperf3 not available, installing...")
-                # Try to install iperf3 if not available
-                try:
-                    board.command("apt-get update && apt-get install -y iperf3", timeout=60)
-                    print("✓ iperf3 installed successfully")
-                except Exception as e:
-                    print(f"✗ Failed to install iperf3: {e}")
-                    print("ℹ Skipping iperf use case test - iperf3 not available")
-                    return
-            else:
-                print("✓ iperf3 is available on the device")
-        except Exception as e:
-            print(f"✗ Error checking iperf3 availability: {e}")
-            print("ℹ Skipping iperf use case test")
-            return
-
-        try:
-            print("🚀 Running actual boardfarm3 iperf use case...")
-
-            # Since our CPE device now has LinuxDevice traffic methods,
-            # we can use it as both source and destination for iperf testing
-            # This simulates a loopback performance test
-
-            # Use the actual boardfarm3 iperf use case
-            # Note: We're using the same device as both source and destination
-            # with loopback IP to test the use case functionality
-            traffic_generator = iperf_use_cases.start_iperf_ipv4(
-                source_device=board,           # CPE device as source
-                destination_device=board,      # CPE device as destination
-                source_port=5201,              # Standard iperf port
-                time=5,                        # 5 second test
-                udp_protocol=False,            # Use TCP
-                destination_ip="127.0.0.1",    # Loopback test
+            client_log = rdk_board.command(
+                f"i=0; while [ $i -lt {polls} ] && "
+                f"kill -0 {traffic_generator.sender_pid} 2>/dev/null && "
+                f"! grep -qs 'iperf Done' {client_log_file}; "
+                f"do sleep 0.2; i=$((i+1)); done; "
+                f"cat {client_log_file}",
+                timeout=test_duration + 15,
             )
+        except Exception:
+            # Break out of the loop so the console is usable for the cleanup,
+            # without hiding the original error if the console cannot do it
+            with contextlib.suppress(Exception):
+                rdk_board.hw.get_console("console").sendcontrol("c")
+            raise
+
+        # Get the results by reading the log files if available
+        performance_results = {}
 
-            print("✓ iPerf traffic generator created successfully")
-            print(f"Traffic generator type: {type(traffic_generator)}")
-            print(f"Traffic generator attributes: {dir(traffic_generator)}")
-
-            # Use the actual attributes available on the traffic generator
-            print(f"Traffic sender: {traffic_generator.traffic_sender}")
-            print(f"Traffic receiver: {traffic_generator.traffic_receiver}")
-            print(f"Sender PID: {traffic_generator.sender_pid}")
-            print(f"Receiver PID: {traffic_generator.receiver_pid}")
-
-            # Wait for the test to complete
-            import time
-            print("⏳ Waiting for iperf test to complete...")
-            time.sleep(7)  # Wait a bit longer than the test duration
-
-            # Get the results by reading the log files if available
-            performance_results = {}
-
-            if hasattr(traffic_generator, 'server_log_file') and traffic_generator.server_log_file:
-                try:
-                    server_log = board.command(f"cat {traffic_generator.server_log_file}", timeout=10)
-                    if server_log and "bits/sec" in server_log:
-                        performance_results["server_log"] = "Available"
-                        print("✓ Server log contains performance data")
-                except Exception:
-                    performance_results["server_log"] = "Not available"
-
-            if hasattr(traffic_generator, 'client_log_file') and traffic_generator.client_log_file:
-                try:
-                    client_log = board.command(f"cat {traffic_generator.client_log_file}", timeout=10)
-                    if client_log and "bits/sec" in client_log:
-                        performance_results["client_log"] = "Available"
-                        print("✓ Client log contains performance data")
-
-                        # Try to parse bandwidth from client log
-                        import re
-                        bw_match = re.search(r'([0-9.]+)\s+([KMGT]?)bits/sec', client_log)
-                        if bw_match:
-                            bandwidth = float(bw_match.group(1))
-                            unit = bw_match.group(2) or ""
-                            performance_results["bandwidth"] = f"{bandwidth} {unit}bits/sec"
-                            print(f"🎯 Measured bandwidth: {bandwidth} {unit}bits/sec")
-                except Exception:
-                    performance_results["client_log"] = "Not available"
-
-            # Clean up: Stop the traffic generator
+        if hasattr(traffic_generator, 'server_log_file') and traffic_generator.server_log_file:
             try:
-                # Import the stop function
-                from boardfarm3.use_cases.iperf import stop_iperf_traffic
-                stop_iperf_traffic(traffic_generator)
-                print("✓ iPerf traffic stopped successfully")
-                performance_results["cleanup"] = "Success"
-            except Exception as e:
-                print(f"ℹ Traffic cleanup attempt: {e}")
-                # Try manual cleanup
-                try:
-                    board.command("pkill -f iperf3", timeout=5)
-                    performance_results["cleanup"] = "Manual cleanup attempted"
-                except:
-                    performance_results["cleanup"] = "Failed"
-
-            # Print results summary
-            print("\n=== Boardfarm3 iPerf Use Case Results ===")
-            for key, value in performance_results.items():
-                print(f"{key}: {value}")
-            print("==========================================\n")
-
-            # Validate that the use case executed successfully
-            assert traffic_generator is not None, "Traffic generator should be created"
-            assert hasattr(traffic_generator, 'traffic_sender'), "Traffic generator should have traffic sender"
-            assert hasattr(traffic_generator, 'traffic_receiver'), "Traffic generator should have traffic receiver"
-            assert hasattr(traffic_generator, 'sender_pid'), "Traffic generator should have sender PID"
-            assert hasattr(traffic_generator, 'receiver_pid'), "Traffic generator should have receiver PID"
-
-            print("✅ Boardfarm3 iperf use case executed successfully!")
+                server_log = rdk_board.command(f"cat {traffic_generator.server_log_file}", timeout=10)
+                if server_log and _BITS_SEC in server_log:
+                    performance_results["server_log"] = "Available"
+                    _LOGGER.info("✓ Server log contains performance data")
+            except Exception:
+                performance_results["server_log"] = "Not available"
+
+        if _BITS_SEC in client_log:
+            performance_results["client_log"] = "Available"
+            _LOGGER.info("✓ Client log contains performance data")
+
+            # Try to parse bandwidth from client log
+            bw_match = _BW_RE.search(client_log)
+            if bw_match:
+                bandwidth = float(bw_match.group(1))
+                unit = bw_match.group(2) or ""
+                performance_results["bandwidth"] = f"{bandwidth} {unit}bits/sec"
+                _LOGGER.info("🎯 Measured bandwidth: %s %sbits/sec", bandwidth, unit)
+        else:
+            performance_results["client_log"] = "Not available"
 
+        # Clean up: Stop the traffic generator
+        try:
+            # Import the stop function
+            from boardfarm3.use_cases.iperf import stop_iperf_traffic
+            stop_iperf_traffic(traffic_generator)
+            _LOGGER.info("✓ iPerf traffic stopped successfully")
+            performance_results["cleanup"] = "Success"
         except Exception as e:
-            print(f"✗ Boardfarm3 iperf use case failed: {e}")
-            # Try to clean up any remaining processes
-            try:
-                board.command("pkill -f iperf3", timeout=5)
-            except:
-                pass
-            # Re-raise the exception to fail the test
-            raise
\ No newline at end of file
+            # Remaining iperf3 processes are killed by the iperf_cleanup fixture
+            _LOGGER.info("ℹ Traffic cleanup attempt: %s", e)
+            performance_results["cleanup"] = "Left to iperf_cleanup"
+
+        # Print results summary
+        _LOGGER.info("=== Boardfarm3 iPerf Use Case Results ===")
+        for key, value in performance_results.items():
+            _LOGGER.info("%s: %s", key, value)
+        _LOGGER.info("==========================================")
+
+        # Validate that the use case executed successfully
+        assert traffic_generator is not None, "Traffic generator should be created"
+        assert hasattr(traffic_generator, 'traffic_sender'), "Traffic generator should have traffic sender"
+        assert hasattr(traffic_generator, 'traffic_receiver'), "Traffic generator should have traffic receiver"
+        assert hasattr(traffic_generator, 'sender_pid'), "Traffic generator should have sender PID"
+        assert hasattr(traffic_generator, 'receiver_pid'), "Traffic generator should have receiver PID"
+
+        _LOGGER.info("✅ Boardfarm3 iperf use case executed successfully!")